@@ -1,15 +1,26 @@
 #!/usr/bin/env python3
 
 import os
+import csv
+import re
 import sys
 import shutil
 import subprocess
-import pandas as pd
+import tempfile
 import json
 import hashlib
+import functools
 import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List
 
+try:
+    import orjson
+except ImportError:  # orjson is optional - fall back to the stdlib json module
+    orjson = None
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -18,32 +29,128 @@ logger = logging.getLogger(__name__)
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
-def build_relationship_files(folder_path: str) -> tuple[list[str], list[str]]:
+def json_loads(data):
+    """Parse JSON from str or bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, indent=False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False, default=str).encode("utf-8")
+
+
+def read_head_and_tail(f, limit: int = 256 * 1024) -> str:
+    """
+    Return an open binary file decoded as UTF-8, keeping the first and last limit/2 bytes when it is longer
+    The earliest errors are usually the most useful and the tail holds the final summary, so both are kept
+    """
+    size = f.seek(0, os.SEEK_END)
+    f.seek(0)
+    if size <= limit:
+        return f.read().decode('utf-8', errors='replace')
+    half = limit // 2
+    head = f.read(half)
+    f.seek(size - half)
+    tail = f.read()
+    return (f"{head.decode('utf-8', errors='replace')}\n... [{size - 2 * half} bytes omitted] ...\n"
+            f"{tail.decode('utf-8', errors='replace')}")
+
+
+def parallel_rmtree(root, workers=8):
+    """shutil.rmtree that removes the top-level children concurrently - unlinks release the GIL"""
+
+    def remove(entry):
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.unlink(entry.path)
+
+    with os.scandir(root) as it:
+        children = list(it)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(remove, children))
+    os.rmdir(root)
+
+
+def write_bytes_atomic(path: str, data: bytes):
+    """
+    Write data to a temp file and rename it over path
+    Files in submit/ may be hardlinks into data/, so they must never be truncated in place
+    """
+    # Unique per process and thread, so concurrent writers never share a temp file
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def link_or_copy(src: str, dst: str) -> str:
+    """
+    copytree copy_function that hardlinks files, falling back to a real copy (e.g. across devices)
+    Linked files are shared with data/, so anything rewritten in submit/ goes through write_bytes_atomic
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
+# Entity file name prefixes that build_relationship_files links to property.json
+_FILE_CATEGORY_RE = re.compile(
+    r"person|company|property|address|lot|tax|sales|layout|flood_storm_information|structure|utility")
+
+
+def build_relationship_files(folder_path: str, json_files: list[str] = None) -> tuple[list[str], list[str]]:
     """
     Build relationship files based on discovered files in the folder
+    json_files can be passed by a caller that already listed the folder, to skip scanning it again
     Returns: (relationship_files, errors)
     """
     relationship_files = []
     errors = []
 
     # Get all JSON files in the folder
-    json_files = [f for f in os.listdir(folder_path) if f.endswith('.json')]
-    sales_person_relations = [f for f in json_files if f.startswith('relationship_sales') and 'person' in f]
+    if json_files is None:
+        with os.scandir(folder_path) as entries:
+            json_files = [e.name for e in entries if e.name.endswith('.json') and e.is_file()]
+    # Categorize files in one pass - no category prefix is a prefix of another, so the first match is the only one
+    sales_person_relations = []
+    sales_company_relations = []
+    categories = defaultdict(list)
+    for f in json_files:
+        if f.startswith('relationship_sales'):
+            if 'person' in f:
+                sales_person_relations.append(f)
+            if 'company' in f:
+                sales_company_relations.append(f)
+            continue
+        match = _FILE_CATEGORY_RE.match(f)
+        if match:
+            categories[match.group(0)].append(f)
     relationship_files.extend(sales_person_relations)
-    sales_company_relations = [f for f in json_files if f.startswith('relationship_sales') and 'company' in f]
     relationship_files.extend(sales_company_relations)
-    # Categorize files
-    person_files = [f for f in json_files if f.startswith('person')]
-    company_files = [f for f in json_files if f.startswith('company')]
-    property_files = [f for f in json_files if f.startswith('property')]
-    address_files = [f for f in json_files if f.startswith('address')]
-    lot_files = [f for f in json_files if f.startswith('lot')]
-    tax_files = [f for f in json_files if f.startswith('tax')]
-    sales_files = [f for f in json_files if f.startswith('sales')]
-    layout_files = [f for f in json_files if f.startswith('layout')]
-    flood_files = [f for f in json_files if f.startswith('flood_storm_information')]
-    structure_files = [f for f in json_files if f.startswith('structure')]
-    utility_files = [f for f in json_files if f.startswith('utility')]
+
+    person_files = categories['person']
+    company_files = categories['company']
+    property_files = categories['property']
+    address_files = categories['address']
+    lot_files = categories['lot']
+    tax_files = categories['tax']
+    sales_files = categories['sales']
+    layout_files = categories['layout']
+    flood_files = categories['flood_storm_information']
+    structure_files = categories['structure']
+    utility_files = categories['utility']
 
     # Ensure we have property.json as the main reference
     if not property_files:
@@ -53,34 +160,35 @@ def build_relationship_files(folder_path: str) -> tuple[list[str], list[str]]:
         return relationship_files, errors
 
     property_file = property_files[0]  # Should be property.json
+    # Every relationship points at property.json from one side - build that IPLD link once and share it
+    property_ref = {"/": f"./{property_file}"}
+    folder_prefix = os.path.join(folder_path, '')  # folder path with a trailing separator, joined once
 
     # Build person/company to property relationships
     for person_file in person_files:
         rel_filename = f"relationship_{person_file.replace('.json', '')}_property.json"
-        rel_path = os.path.join(folder_path, rel_filename)
+        rel_path = folder_prefix + rel_filename
 
         relationship_data = {
             "from": {"/": f"./{person_file}"},
-            "to": {"/": f"./{property_file}"}
+            "to": property_ref
         }
 
-        with open(rel_path, 'w', encoding='utf-8') as f:
-            json.dump(relationship_data, f, indent=2, ensure_ascii=False)
+        write_bytes_atomic(rel_path, json_dumps(relationship_data, indent=True))
 
         relationship_files.append(rel_filename)
         logger.info(f"     📝 Created {rel_filename}")
 
     for company_file in company_files:
         rel_filename = f"relationship_{company_file.replace('.json', '')}_property.json"
-        rel_path = os.path.join(folder_path, rel_filename)
+        rel_path = folder_prefix + rel_filename
 
         relationship_data = {
             "from": {"/": f"./{company_file}"},
-            "to": {"/": f"./{property_file}"}
+            "to": property_ref
         }
 
-        with open(rel_path, 'w', encoding='utf-8') as f:
-            json.dump(relationship_data, f, indent=2, ensure_ascii=False)
+        write_bytes_atomic(rel_path, json_dumps(relationship_data, indent=True))
 
         relationship_files.append(rel_filename)
         logger.info(f"     📝 Created {rel_filename}")
@@ -110,15 +218,14 @@ def build_relationship_files(folder_path: str) -> tuple[list[str], list[str]]:
                 suffix = ''
 
             rel_filename = f"relationship_property_{entity_type}{suffix}.json"
-            rel_path = os.path.join(folder_path, rel_filename)
+            rel_path = folder_prefix + rel_filename
 
             relationship_data = {
-                "from": {"/": f"./{property_file}"},
+                "from": property_ref,
                 "to": {"/": f"./{file}"}
             }
 
-            with open(rel_path, 'w', encoding='utf-8') as f:
-                json.dump(relationship_data, f, indent=2, ensure_ascii=False)
+            write_bytes_atomic(rel_path, json_dumps(relationship_data, indent=True))
 
             relationship_files.append(rel_filename)
             logger.info(f"     📝 Created {rel_filename}")
@@ -126,6 +233,24 @@ def build_relationship_files(folder_path: str) -> tuple[list[str], list[str]]:
     return relationship_files, errors
 
 
+# Every county relationship, null until a relationship file fills it - copied for each county data group
+_ALL_RELATIONSHIPS_TEMPLATE = {
+    "person_has_property": None,
+    "company_has_property": None,
+    "property_has_address": None,
+    "property_has_lot": None,
+    "property_has_tax": None,
+    "property_has_sales_history": None,
+    "property_has_layout": None,
+    "property_has_flood_storm_information": None,
+    "property_has_file": None,
+    "property_has_structure": None,
+    "property_has_utility": None,
+    "sales_history_has_person": None,
+    "sales_history_has_company": None,
+}
+
+
 def create_county_data_group(relationship_files: list[str]) -> dict[str, any]:
     """
     Create the county data group structure based on relationship files
@@ -136,21 +261,7 @@ def create_county_data_group(relationship_files: list[str]) -> dict[str, any]:
     }
 
     # Initialize all possible relationships as null
-    all_relationships = {
-        "person_has_property": None,
-        "company_has_property": None,
-        "property_has_address": None,
-        "property_has_lot": None,
-        "property_has_tax": None,
-        "property_has_sales_history": None,
-        "property_has_layout": None,
-        "property_has_flood_storm_information": None,
-        "property_has_file": None,
-        "property_has_structure": None,
-        "property_has_utility": None,
-        "sales_history_has_person": None,
-        "sales_history_has_company": None,
-    }
+    all_relationships = _ALL_RELATIONSHIPS_TEMPLATE.copy()
 
     # Categorize relationship files
     person_relationships = []
@@ -188,6 +299,8 @@ def create_county_data_group(relationship_files: list[str]) -> dict[str, any]:
             sales_person_relationships.append(ipld_ref)
         elif "relationship_sales_company" in rel_file and "company" in rel_file:
             sales_company_relationships.append(ipld_ref)
+        else:
+            logger.warning(f"⚠️ Relationship file {rel_file} matches no county relationship - left out of the group")
 
     # Set array relationships
     if person_relationships:
@@ -205,12 +318,150 @@ def create_county_data_group(relationship_files: list[str]) -> dict[str, any]:
     if sales_company_relationships:
         all_relationships["sales_history_has_company"] = sales_company_relationships
 
-    # Only include non-null relationships in the final output
-    county_data["relationships"] = {k: v for k, v in all_relationships.items()}
+    # Unfilled relationships stay in the output as null
+    county_data["relationships"] = all_relationships
 
     return county_data
 
 
+# First path segment after an "output" directory, with either separator
+_OUTPUT_FOLDER_RE = re.compile(r"(?:^|[/\\])output[/\\]([^/\\]+)")
+
+
+def load_folder_mapping(upload_results_path: str) -> dict:
+    """
+    Map original output folder names to their propertyCid from upload-results.csv
+    """
+    folder_mapping = {}
+    with open(upload_results_path, newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    logger.info(f"📊 Found {len(rows)} entries in uploadresults.csv")
+
+    # Create mapping from old folder names to new names (propertyCid)
+    for row in rows:
+        # Find the folder right below the "output" directory in the path
+        match = _OUTPUT_FOLDER_RE.search(row['filePath'])
+        if match:
+            old_folder_name = match.group(1)
+            property_cid = row['propertyCid']
+            if old_folder_name not in folder_mapping:
+                folder_mapping[old_folder_name] = property_cid
+                logger.info(f"   📋 Mapping: {old_folder_name} -> {property_cid}")
+
+    return folder_mapping
+
+
+def load_seed_data(seed_csv_path: str) -> dict:
+    """
+    Map parcel_id (original folder name) to its source_http_request and source_identifier from seed.csv
+    """
+    seed_data = {}
+    with open(seed_csv_path, newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    logger.info(f"📊 Found {len(rows)} entries in seed.csv")
+
+    for row in rows:
+        parcel_id = row['parcel_id']
+        # Empty cells mean "no value"
+        method = row.get('method') or None
+        url = row.get('url') or None
+        multiValueQueryString = row.get('multiValueQueryString')
+        seed_data[parcel_id] = {
+            "source_http_request": {
+                "method": method,
+                "url": url,
+                "multiValueQueryString": json_loads(multiValueQueryString) if multiValueQueryString else None,
+            },
+            'source_identifier': row['source_identifier']
+        }
+
+    return seed_data
+
+
+def _prepare_folder(folder_name: str, data_dir: str, submit_dir: str, folder_mapping: dict, seed_data: dict,
+                    county_data_group_cid: str) -> list[str]:
+    """
+    Copy one property folder into submit/, stamp its JSON files with seed data and build its relationships
+    Returns: relationship errors, prefixed with the property name
+    """
+    src_folder_path = os.path.join(data_dir, folder_name)
+
+    # Determine target folder name
+    target_folder_name = folder_mapping.get(folder_name, folder_name)
+    dst_folder_path = os.path.join(submit_dir, target_folder_name)
+
+    # Copy the folder and stamp its JSON files with seed data in a single pass over the source directory.
+    # Files are hardlinked; stamped files are written fresh, so the source in data/ is never touched
+    folder_seed = seed_data.get(folder_name)  # folder_name is the original parcel_id
+    if folder_seed is None:
+        logger.warning(f"   ⚠️ No seed data found for parcel {folder_name}")
+    os.makedirs(dst_folder_path)
+    json_files = []
+    updated_files_count = 0
+    if folder_seed is not None:
+        source_http_request = folder_seed['source_http_request']
+        request_identifier = str(folder_seed['source_identifier'])
+    with os.scandir(src_folder_path) as entries:
+        for entry in entries:
+            dst_path = os.path.join(dst_folder_path, entry.name)
+            if entry.is_dir():
+                shutil.copytree(entry.path, dst_path, copy_function=link_or_copy)
+                continue
+            if not entry.name.endswith('.json'):
+                link_or_copy(entry.path, dst_path)
+                continue
+
+            json_files.append(entry.name)
+            if folder_seed is None:
+                link_or_copy(entry.path, dst_path)
+                continue
+            if "relation" in entry.name.lower():
+                logger.info(f"   🔗 Skipping relationship file: {entry.name}")
+                link_or_copy(entry.path, dst_path)
+                continue
+
+            try:
+                # Read JSON file
+                with open(entry.path, 'rb') as f:
+                    json_data = json_loads(f.read())
+
+                json_data['source_http_request'] = source_http_request
+                json_data['request_identifier'] = request_identifier
+
+                write_bytes_atomic(dst_path, json_dumps(json_data, indent=True))
+
+                updated_files_count += 1
+
+            except json.JSONDecodeError as e:
+                logger.error(f"   ❌ Error parsing JSON file {entry.path}: {e}")
+                link_or_copy(entry.path, dst_path)
+            except Exception as e:
+                logger.error(f"   ❌ Error processing file {entry.path}: {e}")
+                link_or_copy(entry.path, dst_path)
+    logger.info(f"   📂 Copied folder: {folder_name} -> {target_folder_name}")
+
+    if updated_files_count > 0:
+        logger.info(
+            f"   🌱 Updated {updated_files_count} JSON files with seed data for parcel {folder_name}")
+
+    # Build relationship files dynamically - MODIFIED TO CAPTURE ERRORS
+    logger.info(f"   🔗 Building relationship files for {target_folder_name}")
+    relationship_files, relationship_errors = build_relationship_files(dst_folder_path, json_files)
+
+    # Only create county data group if no relationship errors
+    if not relationship_errors:
+        # Create county data group file with all relationships
+        county_data_group = create_county_data_group(relationship_files)
+        county_file_path = os.path.join(dst_folder_path, f"{county_data_group_cid}.json")
+
+        write_bytes_atomic(county_file_path, json_dumps(county_data_group, indent=True))
+
+        logger.info(
+            f"   ✅ Created {county_data_group_cid}.json with {len(relationship_files)} relationship files")
+
+    return [f"Property {folder_name}: {error}" for error in relationship_errors]
+
+
 def main():
     """
     Run the CLI validation command and return results
@@ -231,7 +482,7 @@ def main():
 
         # Create/clean submit directory
         if os.path.exists(submit_dir):
-            shutil.rmtree(submit_dir)
+            parallel_rmtree(submit_dir)
             logger.info("🗑️ Cleaned existing submit directory")
 
         os.makedirs(submit_dir, exist_ok=True)
@@ -244,29 +495,7 @@ def main():
         # Read the uploadresults.csv file for mapping
         folder_mapping = {}
         if os.path.exists(upload_results_path):
-            df = pd.read_csv(upload_results_path)
-            logger.info(f"📊 Found {len(df)} entries in uploadresults.csv")
-
-            # Create mapping from old folder names to new names (propertyCid)
-            for _, row in df.iterrows():
-                file_path = row['filePath']
-                property_cid = row['propertyCid']
-
-                path_parts = file_path.split('/')
-                output_index = -1
-
-                # Find the "output" directory in the path
-                for i, part in enumerate(path_parts):
-                    if part == "output":
-                        output_index = i
-                        break
-
-                if output_index != -1 and output_index + 1 < len(path_parts):
-                    old_folder_name = path_parts[output_index + 1]
-                    if old_folder_name not in folder_mapping:
-                        folder_mapping[old_folder_name] = property_cid
-                        logger.info(f"   📋 Mapping: {old_folder_name} -> {property_cid}")
-
+            folder_mapping = load_folder_mapping(upload_results_path)
             logger.info(f"✅ Created mapping for {len(folder_mapping)} unique folders")
         else:
             logger.warning("⚠️ upload-results.csv not found, using original folder names")
@@ -277,24 +506,7 @@ def main():
         seed_csv_path = os.path.join(BASE_DIR, "seed.csv")
 
         if os.path.exists(seed_csv_path):
-            seed_df = pd.read_csv(seed_csv_path)
-            logger.info(f"📊 Found {len(seed_df)} entries in seed.csv")
-
-            # Create mapping from parcel_id (original folder name) to http_request and source_identifier
-            for _, row in seed_df.iterrows():
-                parcel_id = str(row['parcel_id'])
-                method = row.get('method')
-                url = row.get('url')
-                multiValueQueryString = row.get('multiValueQueryString')
-                seed_data[parcel_id] = {
-                    "source_http_request": {
-                        "method": method,
-                        "url": url,
-                        "multiValueQueryString": json.loads(multiValueQueryString) if multiValueQueryString else None,
-                    },
-                    'source_identifier': row['source_identifier']
-                }
-
+            seed_data = load_seed_data(seed_csv_path)
             logger.info(f"✅ Created seed mapping for {len(seed_data)} parcel IDs")
         else:
             logger.warning("⚠️ seed.csv not found, skipping JSON updates")
@@ -307,75 +519,21 @@ def main():
         # NEW: Collect all relationship building errors
         all_relationship_errors = []
 
-        for folder_name in os.listdir(data_dir):
-            src_folder_path = os.path.join(data_dir, folder_name)
-
-            if os.path.isdir(src_folder_path):
-                # Determine target folder name
-                target_folder_name = folder_mapping.get(folder_name, folder_name)
-                dst_folder_path = os.path.join(submit_dir, target_folder_name)
-
-                # Copy the entire folder
-                shutil.copytree(src_folder_path, dst_folder_path)
-                logger.info(f"   📂 Copied folder: {folder_name} -> {target_folder_name}")
+        # Folders are independent, so copy/seed/relate them in parallel - the work is filesystem and JSON I/O
+        with os.scandir(data_dir) as entries:
+            folder_names = [e.name for e in entries if e.is_dir()]
+        prepare = functools.partial(
+            _prepare_folder,
+            data_dir=data_dir,
+            submit_dir=submit_dir,
+            folder_mapping=folder_mapping,
+            seed_data=seed_data,
+            county_data_group_cid=county_data_group_cid,
+        )
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4)) as executor:
+            for relationship_errors in executor.map(prepare, folder_names):
                 copied_count += 1
-
-                # Update JSON files with seed data (folder_name is the original parcel_id)
-                if folder_name in seed_data:
-                    updated_files_count = 0
-                    for file_name in os.listdir(dst_folder_path):
-                        if file_name.endswith('.json'):
-                            json_file_path = os.path.join(dst_folder_path, file_name)
-
-                            if "relation" in file_name.lower():
-                                logger.info(f"   🔗 Skipping relationship file: {file_name}")
-                                continue
-
-                            try:
-                                # Read JSON file
-                                with open(json_file_path, 'r', encoding='utf-8') as f:
-                                    json_data = json.load(f)
-
-                                json_data['source_http_request'] = seed_data[folder_name]['source_http_request']
-                                json_data['request_identifier'] = str(seed_data[folder_name]['source_identifier'])
-
-                                # Write back to file
-                                with open(json_file_path, 'w', encoding='utf-8') as f:
-                                    json.dump(json_data, f, indent=2, ensure_ascii=False)
-
-                                updated_files_count += 1
-
-                            except json.JSONDecodeError as e:
-                                logger.error(f"   ❌ Error parsing JSON file {json_file_path}: {e}")
-                            except Exception as e:
-                                logger.error(f"   ❌ Error processing file {json_file_path}: {e}")
-
-                    if updated_files_count > 0:
-                        logger.info(
-                            f"   🌱 Updated {updated_files_count} JSON files with seed data for parcel {folder_name}")
-                else:
-                    logger.warning(f"   ⚠️ No seed data found for parcel {folder_name}")
-
-                # Build relationship files dynamically - MODIFIED TO CAPTURE ERRORS
-                logger.info(f"   🔗 Building relationship files for {target_folder_name}")
-                relationship_files, relationship_errors = build_relationship_files(dst_folder_path)
-
-                # Add any relationship errors to our collection
-                if relationship_errors:
-                    for error in relationship_errors:
-                        all_relationship_errors.append(f"Property {folder_name}: {error}")
-
-                # Only create county data group if no relationship errors
-                if not relationship_errors:
-                    # Create county data group file with all relationships
-                    county_data_group = create_county_data_group(relationship_files)
-                    county_file_path = os.path.join(dst_folder_path, f"{county_data_group_cid}.json")
-
-                    with open(county_file_path, 'w', encoding='utf-8') as f:
-                        json.dump(county_data_group, f, indent=2, ensure_ascii=False)
-
-                    logger.info(
-                        f"   ✅ Created {county_data_group_cid}.json with {len(relationship_files)} relationship files")
+                all_relationship_errors.extend(relationship_errors)
 
         # NEW: Check if we have relationship errors before proceeding
         if all_relationship_errors:
@@ -394,14 +552,14 @@ def main():
         # Check prerequisites before running CLI validator
         logger.info("🔍 Checking CLI validator prerequisites...")
 
-        # Check if node/npm are available
-        try:
-            node_result = subprocess.run(["node", "--version"], capture_output=True, text=True, timeout=10)
-            npm_result = subprocess.run(["npm", "--version"], capture_output=True, text=True, timeout=10)
-            logger.info(f"Node.js version: {node_result.stdout.strip()}")
-            logger.info(f"npm version: {npm_result.stdout.strip()}")
-        except Exception as e:
-            logger.error(f"❌ Node.js/npm not available: {e}")
+        # Check if node/npm are available - a PATH lookup, spawning them only when debugging for their versions
+        missing_tools = [tool for tool in ("node", "npm", "npx") if shutil.which(tool) is None]
+        if missing_tools:
+            logger.error(f"❌ Node.js tooling not available: {', '.join(missing_tools)} not found on PATH")
+        elif logger.isEnabledFor(logging.DEBUG):
+            for tool in ("node", "npm"):
+                version = subprocess.run([tool, "--version"], capture_output=True, text=True, timeout=10)
+                logger.debug(f"{tool} version: {version.stdout.strip()}")
 
         # Check if submit directory exists and has content
         submit_dir = os.path.join(BASE_DIR, "submit")
@@ -413,15 +571,22 @@ def main():
 
         logger.info("🔍 Running CLI validator: npx @elephant-xyz/cli validate-and-upload submit --dry-run")
 
+        # CLI output goes straight to anonymous temp files instead of memory or the working tree -
+        # it is only read back when the run fails, and the files vanish once closed
+        cli_output = ""
         try:
-            result = subprocess.run(
-                ["npx", "-y", "@elephant-xyz/cli@1.12.0", "validate-and-upload", "submit", "--dry-run", "--output-csv",
-                 "results.csv"],
-                cwd=BASE_DIR,
-                capture_output=True,
-                text=True,
-                timeout=300  # Keep original 5 minute timeout
-            )
+            with tempfile.TemporaryFile() as cli_stdout, tempfile.TemporaryFile() as cli_stderr:
+                result = subprocess.run(
+                    ["npx", "-y", "@elephant-xyz/cli@1.12.0", "validate-and-upload", "submit", "--dry-run",
+                     "--output-csv", "results.csv"],
+                    cwd=BASE_DIR,
+                    stdout=cli_stdout,
+                    stderr=cli_stderr,
+                    timeout=300  # Keep original 5 minute timeout
+                )
+                if result.returncode != 0:
+                    cli_output = (f"STDOUT:\n{read_head_and_tail(cli_stdout)}\n\n"
+                                  f"STDERR:\n{read_head_and_tail(cli_stderr)}")
         except subprocess.TimeoutExpired as e:
             logger.error("❌ CLI validator timed out after 5 minutes")
             logger.error("This usually indicates:")
@@ -436,20 +601,18 @@ def main():
         if os.path.exists(submit_errors_path):
             # Read the CSV file to check for actual errors
             try:
-                df = pd.read_csv(submit_errors_path)
-                if len(df) > 0:
+                with open(submit_errors_path, newline='', encoding='utf-8') as f:
+                    error_rows = list(csv.DictReader(f))
+                if error_rows:
                     # There are validation errors
-                    logger.warning(f"❌ CLI validation found {len(df)} errors in submit_errors.csv")
+                    logger.warning(f"❌ CLI validation found {len(error_rows)} errors in submit_errors.csv")
 
-                    # Get unique error messages and extract field names from error paths
-                    unique_errors = set()
-                    for _, row in df.iterrows():
-                        error_message = row['error_message']
-                        error_path = row['error_path']
-
-                        # Extract field name from the error path (last part after the last '/')
-                        field_name = error_path.split('/')[-1]
+                    # Reduce rows to distinct (field name, message) pairs first - the same error repeats across
+                    # properties, so each pair is formatted once. The field name is the last part after the last '/'
+                    error_pairs = {(row['error_path'].rpartition('/')[2], row['error_message']) for row in error_rows}
 
+                    unique_errors = set()
+                    for field_name, error_message in error_pairs:
                         # Create formatted error with field name
                         if field_name.startswith('property_has_'):
                             # Extract the type after 'property_has_'
@@ -475,7 +638,7 @@ def main():
             except Exception as e:
                 logger.error(f"Error reading submit_errors.csv: {e}")
                 error_details = f"Could not read submit_errors.csv: {e}"
-                error_hash = hashlib.md5(error_details.encode()).hexdigest()
+                error_hash = hashlib.blake2b(error_details.encode(), digest_size=16).hexdigest()
                 print(f"ERROR: {error_details}")
                 return False, error_details, error_hash
         else:
@@ -486,21 +649,21 @@ def main():
                 return True, "", ""
             else:
                 logger.warning("❌ CLI validation failed")
-                error_output = f"STDOUT:\n{result.stdout}\n\nSTDERR:\n{result.stderr}"
-                error_hash = hashlib.md5(error_output.encode()).hexdigest()
+                error_output = cli_output
+                error_hash = hashlib.blake2b(error_output.encode(), digest_size=16).hexdigest()
                 print(f"ERROR: {error_output}")
                 return False, error_output, error_hash
 
     except subprocess.TimeoutExpired:
         error_msg = "CLI validation timed out after 5 minutes"
         logger.error(error_msg)
-        error_hash = hashlib.md5(error_msg.encode()).hexdigest()
+        error_hash = hashlib.blake2b(error_msg.encode(), digest_size=16).hexdigest()
         print(f"ERROR: {error_msg}")
         return False, error_msg, error_hash
     except Exception as e:
         error_msg = f"CLI validation error: {str(e)}"
         logger.error(error_msg)
-        error_hash = hashlib.md5(error_msg.encode()).hexdigest()
+        error_hash = hashlib.blake2b(error_msg.encode(), digest_size=16).hexdigest()
         print(f"ERROR: {error_msg}")
         return False, error_msg, error_hash
 
@@ -17,6 +17,9 @@ COMPANY_KEYWORDS = [
     'COMPANY', 'LP', 'LLP', 'PLC', 'PC', 'PLLC', 'P.A.', 'P.C.', 'TR', 'Tr', 'DIST'
 ]
 
+# One word-bounded alternation instead of a regex search per keyword per name
+COMPANY_RE = re.compile(r'\b(?:' + '|'.join(re.escape(kw) for kw in COMPANY_KEYWORDS) + r')\b')
+
 
 def parse_owner_name(name):
     """Parse owner name into structured format, same as other scripts"""
@@ -27,19 +30,8 @@ def parse_owner_name(name):
     upper_name = name.upper()
 
     # Check if it's a company - use word boundaries for better matching
-    for kw in COMPANY_KEYWORDS:
-        # For single letters like 'A' from 'P.A.', be more specific
-        if len(kw) == 1:
-            # Only match if it's at the end as a separate word or part of common abbreviations
-            if (upper_name.endswith(' ' + kw) or
-                    'P.A.' in upper_name or 'P.C.' in upper_name or 'L.L.C.' in upper_name):
-                return {'type': 'company', 'name': name}
-        else:
-            # For multi-character keywords, check if it's a separate word
-            import re
-            pattern = r'\b' + re.escape(kw) + r'\b'
-            if re.search(pattern, upper_name):
-                return {'type': 'company', 'name': name}
+    if COMPANY_RE.search(upper_name):
+        return {'type': 'company', 'name': name}
 
     # Person name parsing - same logic as your reference scripts
     # Handle "&" in names (joint ownership)
@@ -1,11 +1,18 @@
 import asyncio
 import argparse
+import base64
+import functools
 import hashlib
+import reprlib
 import sys
+import textwrap
+from collections import Counter, defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Dict, Any, List, TypedDict, Set, Optional
 
 import backoff
 import requests
+from urllib3.util.retry import Retry
 
 from .utils import *
 from urllib.parse import urlparse, parse_qs
@@ -13,10 +20,9 @@ from urllib.parse import urlparse, parse_qs
 # Conditional imports - only load AI dependencies when not in transform mode
 def load_ai_dependencies():
     """Load AI-related dependencies only when needed"""
-    global pd, psutil, StateGraph, END, InMemorySaver, init_chat_model
+    global psutil, StateGraph, END, InMemorySaver, init_chat_model
     global MultiServerMCPClient, StdioConnection, create_react_agent, load_dotenv
     
-    import pandas as pd
     import psutil
     from langgraph.graph import StateGraph, END
     from langgraph.checkpoint.memory import InMemorySaver
@@ -28,7 +34,7 @@ def load_ai_dependencies():
     from langgraph.prebuilt import create_react_agent
     from dotenv import load_dotenv
     
-    return pd, psutil, StateGraph, END, InMemorySaver, init_chat_model, MultiServerMCPClient, StdioConnection, create_react_agent, load_dotenv
+    return psutil, StateGraph, END, InMemorySaver, init_chat_model, MultiServerMCPClient, StdioConnection, create_react_agent, load_dotenv
 
 # Try to load .env from multiple locations (only if dotenv is available)
 try:
@@ -60,6 +66,20 @@ SCRIPTS_DIR = os.path.join(BASE_DIR, "scripts")
 DATA_DIR = os.path.join(BASE_DIR, "data")
 PROCESSED_DIR = os.path.join(BASE_DIR, "processed")
 INPUT_DIR = os.path.join(BASE_DIR, "input")
+SUBMIT_ERRORS_PATH = os.path.join(BASE_DIR, "submit_errors.csv")
+# uv virtualenv the MCP code executor runs generated scripts in
+VENV_DIR = os.path.join(BASE_DIR, ".venv")
+# Schema documents keyed by CID - content addressed, so entries never go stale
+SCHEMA_CACHE_DIR = os.path.join(BASE_DIR, ".cache", "schemas")
+
+# How many recent CLI error reports to keep in state['error_history']
+ERROR_HISTORY_LIMIT = 10
+# Approximate token budget of shared-thread history sent to the model each turn; the checkpoint keeps it all
+MAX_HISTORY_TOKENS = int(os.getenv("MAX_HISTORY_TOKENS", "60000"))
+# Wall-clock limit for one script run by execute_code_files_concurrently; the script is killed when it expires
+SCRIPT_TIMEOUT_SECONDS = int(os.getenv("SCRIPT_TIMEOUT_SECONDS", "300"))
+# Bytes of script output returned to the agent - the head and the tail are kept, the middle is dropped
+SCRIPT_OUTPUT_LIMIT = 64 * 1024
 #
 # # IPFS CIDs for schemas
 SCHEMA_CIDS = {
@@ -76,62 +96,39 @@ SCHEMA_CIDS = {
     "utility.json": "bafkreib3wrmiwqyi34xdengoyud4aplz5rbsjs6vag4eic4n7ohturx6xq"
 }
 
-# Create logs directory
-LOGS_DIR = os.path.join(BASE_DIR, "logs")
-os.makedirs(LOGS_DIR, exist_ok=True)
-
-# Configure logging to file
-log_file_path = os.path.join(LOGS_DIR, f"workflow_{int(time.time())}.log")
-
-# Create file handler for detailed logs
-file_handler = logging.FileHandler(log_file_path, encoding='utf-8')
-file_handler.setLevel(logging.INFO)
-file_formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-file_handler.setFormatter(file_formatter)
-
-# Create console handler for status messages only
-console_handler = logging.StreamHandler(sys.stdout)
-console_handler.setLevel(logging.CRITICAL)  # Only show critical messages
-
-# Configure root logger
-logging.basicConfig(
-    level=logging.INFO,
-    handlers=[file_handler, console_handler]
-)
-
+# Logging (file + console handlers behind a QueueListener) is configured in utils
 logger = logging.getLogger(__name__)
 
 
 class HangDetector:
-    """Detects and recovers from hanging AI agents"""
+    """Detects and recovers from hanging AI agents, checking on each event instead of polling"""
 
-    def __init__(self, timeout_seconds=120, check_interval=10):
+    def __init__(self, timeout_seconds=120):
         self.timeout_seconds = timeout_seconds
-        self.check_interval = check_interval
-        self.last_activity = time.time()
+        self.last_activity = time.monotonic()
         self.is_monitoring = False
-        self.monitor_task = None
         self.hang_callbacks = []
         self.activity_log = []
         self.consecutive_same_events = 0
         self.last_event_type = None
+        self._hang_tasks = set()  # running async hang callbacks - held so they are not garbage-collected mid-run
 
     def start_monitoring(self):
         """Start monitoring for hangs"""
         self.is_monitoring = True
-        self.last_activity = time.time()
-        self.monitor_task = asyncio.create_task(self._monitor_loop())
+        self.last_activity = time.monotonic()
         logger.info(f"🔍 Hang detector started - timeout: {self.timeout_seconds}s")
 
     def stop_monitoring(self):
-        """Stop monitoring"""
+        """Stop monitoring and cancel any hang callbacks still running"""
         self.is_monitoring = False
-        if self.monitor_task:
-            self.monitor_task.cancel()
+        for task in self._hang_tasks:
+            task.cancel()
 
     def update_activity(self, event_type: str = "activity"):
-        """Update last activity timestamp"""
-        current_time = time.time()
+        """Update last activity timestamp and check the new event for hang patterns"""
+        current_time = time.monotonic()
+        time_since_activity = current_time - self.last_activity
         self.last_activity = current_time
 
         # Track event patterns
@@ -150,35 +147,20 @@ class HangDetector:
         if len(self.activity_log) > 20:
             self.activity_log.pop(0)
 
+        if not self.is_monitoring:
+            return
+
+        # Silence between events is caught by the caller's per-event timeout; this catches runaway patterns
+        hang_type = self._detect_hang_type(time_since_activity)
+        if hang_type:
+            logger.error(f"🚨 HANG DETECTED: {hang_type}")
+            self.is_monitoring = False
+            self._handle_hang(hang_type)
+
     def add_hang_callback(self, callback):
         """Add callback to execute when hang is detected"""
         self.hang_callbacks.append(callback)
 
-    async def _monitor_loop(self):
-        """Main monitoring loop"""
-        while self.is_monitoring:
-            try:
-                await asyncio.sleep(self.check_interval)
-
-                if not self.is_monitoring:
-                    break
-
-                current_time = time.time()
-                time_since_activity = current_time - self.last_activity
-
-                # Check for different types of hangs
-                hang_type = self._detect_hang_type(time_since_activity)
-
-                if hang_type:
-                    logger.error(f"🚨 HANG DETECTED: {hang_type}")
-                    await self._handle_hang(hang_type)
-                    break
-
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error in hang monitor: {e}")
-
     # FIND this method in your HangDetector class and REPLACE it:
 
     def _detect_hang_type(self, time_since_activity) -> Optional[str]:
@@ -216,7 +198,7 @@ class HangDetector:
 
         return None
 
-    async def _handle_hang(self, hang_type: str):
+    def _handle_hang(self, hang_type: str):
         """Handle detected hang"""
         logger.error(f"🚨 EXECUTING HANG RECOVERY: {hang_type}")
 
@@ -224,12 +206,20 @@ class HangDetector:
         for callback in self.hang_callbacks:
             try:
                 if asyncio.iscoroutinefunction(callback):
-                    await callback(hang_type)
+                    task = asyncio.ensure_future(callback(hang_type))
+                    self._hang_tasks.add(task)
+                    task.add_done_callback(self._hang_task_done)
                 else:
                     callback(hang_type)
             except Exception as e:
                 logger.error(f"Error in hang callback: {e}")
 
+    def _hang_task_done(self, task: asyncio.Task):
+        """Forget a finished async hang callback and log its exception, which nothing else retrieves"""
+        self._hang_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Error in hang callback: {task.exception()}")
+
 
 class ProcessKiller:
     """Kills hanging processes"""
@@ -263,6 +253,88 @@ class HangRecoveryException(Exception):
     pass
 
 
+STATUS_ACCEPTED = "STATUS: ACCEPTED"
+
+
+def is_status_accepted(message: str) -> bool:
+    """Check an evaluator reply for STATUS: ACCEPTED"""
+    return STATUS_ACCEPTED in message
+
+
+_ERROR_RE = re.compile("error", re.IGNORECASE)
+_PARAGRAPH_BREAK_RE = re.compile(r"\n[ \t]*\n")
+_TRAILING_SPACE_RE = re.compile(r"[ \t]+$", re.MULTILINE)
+
+
+def tool_output_has_error(tool_output) -> bool:
+    """Case-insensitive "error" check on a tool result without building a lowercased copy"""
+    # Structured results that carry an "error" key need no text scan at all
+    if isinstance(tool_output, dict) and 'error' in tool_output:
+        return True
+    # Tool messages: scan their content rather than str() of the whole message object
+    text = getattr(tool_output, 'content', tool_output)
+    if isinstance(text, (bytes, bytearray)):
+        text = text.decode('utf-8', 'ignore')
+    elif not isinstance(text, str):
+        text = str(text)
+    return _ERROR_RE.search(text) is not None
+
+
+# Bounded repr for log previews: long strings and containers are elided instead of fully stringified
+_LOG_REPR = reprlib.Repr()
+_LOG_REPR.maxstring = 200
+_LOG_REPR.maxother = 200
+
+
+def log_preview(value, limit: int) -> str:
+    """Short text for a log line: a message's content (or the value itself) cut at limit characters"""
+    text = getattr(value, 'content', value)
+    if not isinstance(text, str):
+        text = _LOG_REPR.repr(text)
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+def compact_prompt(prompt: str) -> str:
+    """Dedent each paragraph of a system prompt and drop padding whitespace, so every turn resends fewer tokens"""
+    paragraphs = (textwrap.dedent(p) for p in _PARAGRAPH_BREAK_RE.split(prompt))
+    return "\n\n".join(_TRAILING_SPACE_RE.sub("", p).strip("\n") for p in paragraphs if p.strip())
+
+
+def build_system_prompt(prompt: str):
+    """Compact a system prompt; on Anthropic models also mark it cacheable so every turn and restart reuses it"""
+    text = compact_prompt(prompt)
+    # OpenAI caches long prefixes automatically and rejects unknown content-block keys
+    if not MODEL_NAME.startswith(("claude", "anthropic:")):
+        return text
+    from langchain_core.messages import SystemMessage
+    return SystemMessage(content=[{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}])
+
+
+def release_thread_checkpoints(checkpointer, thread_id: str):
+    """Drop an abandoned thread's checkpoints so restarts don't keep old conversations in memory"""
+    checkpointer.delete_thread(thread_id)
+    logger.info(f"🧹 Released checkpoints for thread {thread_id} ({len(checkpointer.storage)} threads still held)")
+
+
+# Shared by every generator prompt whose script reads all of ./input/
+GENERATED_SCRIPT_RULES = """⚡ SCRIPT PERFORMANCE RULES:
+- Read the input files concurrently instead of opening them one by one, e.g.
+  `with ThreadPoolExecutor(max_workers=16) as pool: contents = list(pool.map(read_file, paths))`,
+  then parse each file's content
+- Load and dump JSON through orjson when it is installed, falling back to the stdlib:
+  `try: import orjson; loads = orjson.loads` / `except ImportError: import json; loads = json.loads`
+  (orjson.dumps returns bytes - write output files in 'wb' mode, or fall back to json.dump)
+- Compile regexes and build lookup dicts ONCE at module level (e.g. `_COMPANY_RE = re.compile(...)`),
+  never inside the per-file or per-record functions
+- Re-runs must be incremental: keep `owners/.cache/<script_name>.json` mapping each input file to the
+  hashlib.blake2b digest of its bytes plus the extracted result, and reuse the cached result when the
+  digest is unchanged. Include the script's own digest in the cache and drop the cache when it changes
+"""
+
+SAMPLE_SELECTION_RULE = """🎲 SAMPLE SELECTION: pick samples deterministically and read ONLY those files -
+  `sample_ids = sorted(ids)[::max(1, len(ids) // 3)][:3]`; never read every input file just to choose 3"""
+
+
 class WorkflowState(TypedDict):
     """State shared between nodes"""
     input_files: List[str]
@@ -280,7 +352,7 @@ class WorkflowState(TypedDict):
     retry_count: int
     max_retries: int
     all_files_processed: bool
-    error_history: List[str]  # Track recent errors
+    error_history: "deque[str]"  # Recent errors, bounded by ERROR_HISTORY_LIMIT
     consecutive_same_errors: int  # Count of same errors in a row
     last_error_hash: str  # Hash of last error for comparison
     generation_restart_count: int  # Track how many times we've restarted
@@ -290,6 +362,12 @@ class WorkflowState(TypedDict):
     county_data_group_cid: str
 
 
+def list_input_files() -> List[str]:
+    """List HTML/JSON file names in the input folder with a single scandir pass"""
+    with os.scandir(INPUT_DIR) as entries:
+        return [e.name for e in entries if e.name.endswith(('.html', '.json')) and e.is_file()]
+
+
 def validate_local_files() -> bool:
     """Validate that required input folder and seed.csv exist locally"""
 
@@ -301,7 +379,7 @@ def validate_local_files() -> bool:
         return False
 
     # Check if input folder has HTML/JSON files
-    input_files = [f for f in os.listdir(INPUT_DIR) if f.endswith(('.html', '.json'))]
+    input_files = list_input_files()
     if not input_files:
         print("ERROR: No HTML or JSON files found in the input folder.")
         print(f"Please add HTML or JSON files to: {INPUT_DIR}")
@@ -371,14 +449,14 @@ def validate_and_extract_simple_zip(zip_path: str) -> bool:
 
             # Clean and create input directory
             if os.path.exists(INPUT_DIR):
-                shutil.rmtree(INPUT_DIR)
+                parallel_rmtree(INPUT_DIR)
             os.makedirs(INPUT_DIR, exist_ok=True)
 
             # Extract unnormalized_address.json to base directory
             address_file = address_files[0]
             with zip_ref.open(address_file) as source, open(os.path.join(BASE_DIR, 'unnormalized_address.json'),
                                                             'wb') as target:
-                target.write(source.read())
+                shutil.copyfileobj(source, target)
             logger.info(f"✅ Extracted {address_file} -> unnormalized_address.json")
 
             # Also look for and extract property_seed.json if it exists
@@ -392,14 +470,14 @@ def validate_and_extract_simple_zip(zip_path: str) -> bool:
                 property_seed_file = property_seed_files[0]
                 with zip_ref.open(property_seed_file) as source, open(os.path.join(BASE_DIR, 'property_seed.json'),
                                                                       'wb') as target:
-                    target.write(source.read())
+                    shutil.copyfileobj(source, target)
                 logger.info(f"✅ Extracted {property_seed_file} -> property_seed.json")
 
             # Extract the actual data file (HTML/JSON) to input directory
             data_file = data_files[0]
             data_filename = os.path.basename(data_file)
             with zip_ref.open(data_file) as source, open(os.path.join(INPUT_DIR, data_filename), 'wb') as target:
-                target.write(source.read())
+                shutil.copyfileobj(source, target)
             logger.info(f"✅ Extracted {data_file} -> input/{data_filename}")
 
             print_status(f"Successfully extracted unnormalized_address.json, property_seed.json, and {data_filename}")
@@ -536,7 +614,11 @@ async def run_simple_workflow(args=None):
 
     # Step 4: Check if we should create output ZIP
     data_dir = os.path.join(BASE_DIR, "data")
-    has_data = os.path.exists(data_dir) and len(os.listdir(data_dir)) > 0
+    has_data = False
+    if os.path.exists(data_dir):
+        # Stop at the first entry instead of listing the whole directory
+        with os.scandir(data_dir) as entries:
+            has_data = next(entries, None) is not None
 
     if critical_script_failed or not has_data:
         logger.error("❌ Critical failure detected or no data generated")
@@ -593,8 +675,8 @@ async def run_simple_workflow(args=None):
 
 
 def update_agent_activity(state: WorkflowState):
-    """Update the last agent activity timestamp"""
-    state['last_agent_activity'] = time.time()
+    """Update the last agent activity timestamp (monotonic clock, immune to wall-clock jumps)"""
+    state['last_agent_activity'] = time.monotonic()
 
 
 def is_agent_frozen(state: WorkflowState) -> bool:
@@ -602,7 +684,7 @@ def is_agent_frozen(state: WorkflowState) -> bool:
     if 'last_agent_activity' not in state or state['last_agent_activity'] == 0:
         return False
 
-    elapsed = time.time() - state['last_agent_activity']
+    elapsed = time.monotonic() - state['last_agent_activity']
     return elapsed > state['agent_timeout_seconds']
 
 
@@ -616,14 +698,15 @@ def parse_multi_value_query_string(query_string_value):
     """
     Robust parser for multiValueQueryString that handles both JSON and Python dict formats
     """
-    if not query_string_value or pd.isna(query_string_value):
+    # NaN is the only value not equal to itself - covers empty CSV cells without importing pandas
+    if not query_string_value or query_string_value != query_string_value:
         return None
 
     query_string_str = str(query_string_value).strip()
 
     # Method 1: Try JSON parsing first (handles double quotes)
     try:
-        return json.loads(query_string_str)
+        return json_loads(query_string_str)
     except (json.JSONDecodeError, ValueError):
         pass
 
@@ -638,7 +721,7 @@ def parse_multi_value_query_string(query_string_value):
     try:
         # Replace single quotes with double quotes for JSON parsing
         json_string = query_string_str.replace("'", '"')
-        return json.loads(json_string)
+        return json_loads(json_string)
     except json.JSONDecodeError:
         pass
 
@@ -771,6 +854,7 @@ Execute your scripts and verify the files contain real owner data before finishi
 
                 STEP 2: ANALYSIS & CATEGORIZATION PHASE:
                    - PICK 3 samples of the input files to do validation check on it 
+                   {SAMPLE_SELECTION_RULE}
                    - Compare the owners/owners_schema.json file with the input files
                    - Analyze each extracted owner name to determine if it's a Person or Company
                    - ensure it contains actual owner names (not nulls/empty)
@@ -859,6 +943,7 @@ Execute your scripts and verify the files contain real owner data before finishi
                 }}
                 ```
 
+                {GENERATED_SCRIPT_RULES}
                 ⚠️ CRITICAL RULES:
                 - **NEVER CREATE A NEW SCRIPT WITHOUT FIRST CHECKING FOR EXISTING ONE**
                 - **ALWAYS RUN EXISTING SCRIPT FIRST AND CHECK OUTPUT**
@@ -882,7 +967,7 @@ Execute your scripts and verify the files contain real owner data before finishi
         return create_react_agent(
             model=self.model,
             tools=self.tools,
-            prompt=owner_analysis_prompt,
+            prompt=build_system_prompt(owner_analysis_prompt),
             checkpointer=self.checkpointer  # Use independent checkpointer
         )
 
@@ -891,7 +976,7 @@ Execute your scripts and verify the files contain real owner data before finishi
 
         update_agent_activity(self.state)
 
-        logger.info(f"     🗣️ {agent_name} speaking (Turn {turn})...")
+        logger.info("     🗣️ %s speaking (Turn %s)...", agent_name, turn)
 
         config = {
             "configurable": {"thread_id": self.thread_id},  # Use independent thread
@@ -904,43 +989,39 @@ Execute your scripts and verify the files contain real owner data before finishi
         }]
 
         agent_response = ""
-        tool_calls_made = []
+        tool_calls_made = Counter()
+
+        # Checked once per turn; guards the str()/slice work that only feeds log lines
+        log_info = logger.isEnabledFor(logging.INFO)
 
         try:
             timeout_seconds = self.state['agent_timeout_seconds']
-            last_activity = time.time()
-
-            async def check_inactivity():
-                nonlocal last_activity
-                while True:
-                    await asyncio.sleep(10)
-                    current_time = time.time()
-                    if current_time - last_activity > timeout_seconds:
-                        logger.error(f"     ⏰ {agent_name} INACTIVITY TIMEOUT after {timeout_seconds} seconds")
-                        raise asyncio.TimeoutError(f"{agent_name} inactive for {timeout_seconds} seconds")
-
-            inactivity_task = asyncio.create_task(check_inactivity())
+            events = agent.astream_events({"messages": messages}, config, version="v2")
 
             try:
-                async for event in agent.astream_events({"messages": messages}, config, version="v1"):
-                    last_activity = time.time()
+                while True:
+                    # Inactivity timeout: each event must arrive within timeout_seconds of the previous one
+                    try:
+                        event = await asyncio.wait_for(events.__anext__(), timeout=timeout_seconds)
+                    except StopAsyncIteration:
+                        break
                     update_agent_activity(self.state)
 
                     kind = event["event"]
 
                     if kind == "on_tool_start":
                         tool_name = event['name']
-                        tool_output = event['data'].get('output', '')
-                        logger.info(f"       🔧 {agent_name} using tool: {tool_name}")
-                        logger.info(f"       📝 Tool input: {str(tool_output)[:150]}...")
-                        tool_calls_made.append(tool_name)
+                        logger.info("       🔧 %s using tool: %s", agent_name, tool_name)
+                        if log_info:
+                            logger.info("       📝 Tool input: %s", log_preview(event['data'].get('input', {}), 150))
+                        tool_calls_made[tool_name] += 1
 
                     elif kind == "on_tool_end":
-                        tool_name = event['name']
-                        tool_output = event['data'].get('output', '')
-                        success_indicator = "✅" if "error" not in str(tool_output).lower() else "❌"
-                        logger.info(f"       {success_indicator} {agent_name} tool {tool_name} completed")
-                        logger.info(f"       📤 Result: {str(tool_output)[:100]}...")
+                        if log_info:
+                            tool_output = event['data'].get('output', '')
+                            success_indicator = "❌" if tool_output_has_error(tool_output) else "✅"
+                            logger.info("       %s %s tool %s completed", success_indicator, agent_name, event['name'])
+                            logger.info("       📤 Result: %s", log_preview(tool_output, 100))
 
                     elif kind == "on_chain_end":
                         output = event['data'].get('output', '')
@@ -950,47 +1031,151 @@ Execute your scripts and verify the files contain real owner data before finishi
                                 agent_response = last_message.content
 
             finally:
-                inactivity_task.cancel()
-                try:
-                    await inactivity_task
-                except asyncio.CancelledError:
-                    pass
+                await events.aclose()
+                update_agent_activity(self.state)
 
-            logger.info(f"     ✅ {agent_name} finished speaking")
+            logger.info("     ✅ %s finished speaking", agent_name)
             return agent_response or f"{agent_name} completed turn {turn}"
 
         except asyncio.TimeoutError:
-            logger.error(f"     ⏰ {agent_name} INACTIVITY TIMEOUT")
+            logger.error("     ⏰ %s INACTIVITY TIMEOUT", agent_name)
             raise Exception(f"{agent_name} timed out - restarting")
         except Exception as e:
-            logger.error(f"     ❌ {agent_name} error: {str(e)}")
+            logger.error("     ❌ %s error: %s", agent_name, e)
             return f"{agent_name} error on turn {turn}: {str(e)}"
 
 
+async def _run_python_script(script_path: str) -> str:
+    """Run one script the way the MCP code executor does (activated .venv, from BASE_DIR) and return its exit
+    status and combined output, killing it after SCRIPT_TIMEOUT_SECONDS"""
+    venv_bin = os.path.join(VENV_DIR, "Scripts" if os.name == "nt" else "bin")
+    venv_python = os.path.join(venv_bin, "python")
+    python = venv_python if os.path.exists(venv_python) else sys.executable
+    # Same environment as an activated venv, which is what the code executor's venv-uv mode runs scripts in
+    env = dict(os.environ, VIRTUAL_ENV=VENV_DIR, PATH=venv_bin + os.pathsep + os.environ.get("PATH", ""))
+
+    process = await asyncio.create_subprocess_exec(
+        python, script_path,
+        cwd=BASE_DIR,
+        env=env,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+    )
+
+    # Keep the first and last half of the limit; the earliest and the final lines (tracebacks) matter most
+    half_limit = SCRIPT_OUTPUT_LIMIT // 2
+    head = bytearray()
+    tail = bytearray()
+    dropped = 0
+
+    async def collect_output():
+        nonlocal dropped
+        while True:
+            chunk = await process.stdout.read(64 * 1024)
+            if not chunk:
+                break
+            if len(head) < half_limit:
+                room = half_limit - len(head)
+                head.extend(chunk[:room])
+                chunk = chunk[room:]
+            tail.extend(chunk)
+            if len(tail) > half_limit:
+                dropped += len(tail) - half_limit
+                del tail[:len(tail) - half_limit]
+        await process.wait()
+
+    try:
+        await asyncio.wait_for(collect_output(), timeout=SCRIPT_TIMEOUT_SECONDS)
+        status = "OK" if process.returncode == 0 else f"ERROR (exit code {process.returncode})"
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        status = f"TIMEOUT (killed after {SCRIPT_TIMEOUT_SECONDS}s)"
+    except asyncio.CancelledError:
+        process.kill()
+        raise
+
+    output = head.decode('utf-8', errors='ignore')
+    if dropped:
+        output += f"\n... [{dropped} bytes of output omitted] ...\n"
+    output += tail.decode('utf-8', errors='ignore')
+    return f"=== {script_path}: {status} ===\n{output}"
+
+
+async def execute_code_files_concurrently(file_paths: List[str]) -> str:
+    """Run several independent Python scripts at the same time and return each script's output.
+
+    Use this instead of calling execute_code_file once per script, e.g. for
+    scripts/structure_extractor.py, scripts/utility_extractor.py and scripts/layout_extractor.py.
+    """
+    results = await asyncio.gather(*(_run_python_script(path) for path in file_paths))
+    return "\n\n".join(results)
+
+
+def build_concurrent_execute_tool():
+    """Wrap execute_code_files_concurrently as a LangChain tool"""
+    from langchain_core.tools import StructuredTool
+    return StructuredTool.from_function(coroutine=execute_code_files_concurrently)
+
+
+def trim_history_hook(state):
+    """pre_model_hook: send the model only the newest MAX_HISTORY_TOKENS of a long shared thread"""
+    from langchain_core.messages import HumanMessage, SystemMessage, trim_messages
+    from langchain_core.messages.utils import count_tokens_approximately
+    messages = state["messages"]
+    trimmed = trim_messages(
+        messages,
+        strategy="last",
+        token_counter=count_tokens_approximately,
+        max_tokens=MAX_HISTORY_TOKENS,
+        start_on="human",
+        include_system=True,
+    )
+    if not trimmed:
+        # The newest turn alone is over budget - send just that turn (from its human message on), never the
+        # whole history
+        last_human = next((i for i in range(len(messages) - 1, -1, -1) if isinstance(messages[i], HumanMessage)), 0)
+        trimmed = messages[last_human:]
+        if last_human and isinstance(messages[0], SystemMessage):
+            trimmed = [messages[0], *trimmed]
+    return {"llm_input_messages": trimmed}
+
+
 class StructureGeneratorEvaluatorPair:
     """Generator and Evaluator for structure extraction node with validation"""
 
     def __init__(self, state: WorkflowState, model, tools, schemas: Dict[str, Any]):
         self.state = state
         self.model = model
-        self.tools = tools
+        # The three extractor scripts are independent, so the generator can run them in one concurrent call
+        self.tools = [*tools, build_concurrent_execute_tool()]
         self.schemas = schemas
         self.max_conversation_turns = 15
         self.shared_checkpointer = InMemorySaver()
         self.shared_thread_id = "structure-conversation-1"
         self.consecutive_script_failures = 0
         self.max_script_failures = 3
+        # Compiled once and reused across restarts - a restart only needs a fresh thread
+        self._generator_agent = None
+        self._evaluator_agent = None
 
-    async def _restart_generation_process(self) -> WorkflowState:
-        """Restart the generation process with a fresh thread"""
-        logger.info("🔄 RESTARTING STRUCTURE EXTRACTION PROCESS - Creating new thread and agents")
+    async def _get_agents(self):
+        """Compile the generator and evaluator graphs on first use and return them"""
+        if self._generator_agent is None:
+            self._generator_agent = await self._create_structure_generator_agent()
+            self._evaluator_agent = await self._create_structure_evaluator_agent()
+        return self._generator_agent, self._evaluator_agent
+
+    def _restart_generation_process(self):
+        """Reset for a fresh attempt on a new thread"""
+        logger.info("🔄 RESTARTING STRUCTURE EXTRACTION PROCESS - Creating new thread")
 
         self.state['last_agent_activity'] = 0
         self.state['generation_restart_count'] += 1
 
-        # Create new thread ID for fresh start
+        # New thread ID gives the reused agents an empty conversation; the old one is no longer needed
+        release_thread_checkpoints(self.shared_checkpointer, self.shared_thread_id)
         self.shared_thread_id = f"structure-conversation-restart-{self.state['generation_restart_count']}"
-        self.shared_checkpointer = InMemorySaver()
 
         # Reset conversation state
         self.max_conversation_turns = 15
@@ -998,18 +1183,21 @@ class StructureGeneratorEvaluatorPair:
         logger.info(f"🆕 Starting fresh structure extraction attempt #{self.state['generation_restart_count']}")
         logger.info(f"🆕 New thread ID: {self.shared_thread_id}")
 
-        return await self.run_feedback_loop()
-
     async def run_feedback_loop(self) -> WorkflowState:
-        """Run Structure Generator + Evaluator CONVERSATION"""
+        """Run Structure Generator + Evaluator CONVERSATION, restarting on a fresh thread when needed"""
+        # Iterate instead of recursing so repeated restarts don't stack feedback loops
+        while await self._run_conversation():
+            self._restart_generation_process()
+        return self.state
+
+    async def _run_conversation(self) -> bool:
+        """Run one conversation on the current thread; returns True if it must be restarted"""
 
         logger.info("🔄 Starting Structure Generator + Evaluator CONVERSATION")
         logger.info(f"💬 Using shared thread: {self.shared_thread_id}")
         logger.info(f"🎭 Two agents: Generator, Evaluator")
 
-        # Create agents
-        generator_agent = await self._create_structure_generator_agent()
-        evaluator_agent = await self._create_structure_evaluator_agent()
+        generator_agent, evaluator_agent = await self._get_agents()
 
         conversation_turn = 0
         evaluator_accepted = False
@@ -1026,7 +1214,7 @@ class StructureGeneratorEvaluatorPair:
         except Exception as e:
             if "timed out" in str(e):
                 logger.warning("⏰ Agent timeout during initial STRUCTURE_GENERATOR - restarting")
-                return await self._restart_generation_process()
+                return True
             raise
 
         # Continue conversation until evaluator accepts or max turns
@@ -1036,11 +1224,11 @@ class StructureGeneratorEvaluatorPair:
             if hasattr(self, 'force_restart_now') and self.force_restart_now:
                 logger.warning("🔄 Structure extraction script failure restart triggered - restarting now")
                 self.force_restart_now = False
-                return await self._restart_generation_process()
+                return True
 
             if should_restart_due_to_timeout(self.state):
                 logger.warning("⏰ Agent timeout detected - restarting structure extraction process")
-                return await self._restart_generation_process()
+                return True
 
             logger.info(f"💬 Structure Extraction Turn {conversation_turn}/{self.max_conversation_turns}")
 
@@ -1057,16 +1245,16 @@ class StructureGeneratorEvaluatorPair:
 
                      """,
                 )
-                logger.info(f"🔍 DEBUG: Full evaluator response:")
-                logger.info(f"📝 {evaluator_message}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("🔍 Full evaluator response:\n📝 %s", evaluator_message)
 
             except Exception as e:
                 if "timed out" in str(e):
                     logger.warning("⏰ Agent timeout during STRUCTURE_EVALUATOR - restarting")
-                    return await self._restart_generation_process()
+                    return True
                 raise
 
-            evaluator_accepted = "STATUS: ACCEPTED" in evaluator_message
+            evaluator_accepted = is_status_accepted(evaluator_message)
             logger.info(f"📊 Structure Evaluator decision: {'ACCEPTED' if evaluator_accepted else 'NEEDS FIXES'}")
 
             # Check if evaluator accepted
@@ -1109,7 +1297,7 @@ class StructureGeneratorEvaluatorPair:
             logger.warning(f"Evaluator: {'✅' if evaluator_accepted else '❌'}")
 
         logger.info(f"💬 Structure extraction conversation completed with status: {final_status}")
-        return self.state
+        return False
 
     async def _create_structure_generator_agent(self):
         """Create Structure Generator agent"""
@@ -1126,6 +1314,9 @@ class StructureGeneratorEvaluatorPair:
         🎯 YOUR MISSION: 
         Extract structure, utility, and layout information from property input files using three separate scripts.
         And YOU MUST create the validation script, do not ask generator to create it
+        In the validation script, load each schema from ./schemas/ ONCE at module level and build ONE
+        `jsonschema.Draft7Validator(schema)` per schema, then reuse it for every property via
+        `validator.iter_errors(record)` - never call `jsonschema.validate(...)` inside the per-property loop
 
         📂 INPUT STRUCTURE:
         - Input files are located in ./input/ directory ({self.state['input_files_count']} files)
@@ -1136,18 +1327,18 @@ class StructureGeneratorEvaluatorPair:
         STEP 1: CHECK FOR EXISTING SCRIPTS AND RUN THEM
         1. **CHECK STRUCTURE SCRIPT**: 
            - Check if scripts/structure_extractor.py exists using read_file tool
-           - If EXISTS: Run it using execute_code_file tool
-           - Check if owners/structure_data.json was created
+           - Output: owners/structure_data.json
 
         2. **CHECK UTILITY SCRIPT**:
            - Check if scripts/utility_extractor.py exists using read_file tool
-           - If EXISTS: Run it using execute_code_file tool
-           - Check if owners/utility_data.json was created
+           - Output: owners/utility_data.json
 
         3. **CHECK LAYOUT SCRIPT**:
            - Check if scripts/layout_extractor.py exists using read_file tool
-           - If EXISTS: Run it using execute_code_file tool
-           - Check if owners/layout_data.json was created
+           - Output: owners/layout_data.json
+
+        Run ALL existing scripts in ONE call with the execute_code_files_concurrently tool
+        (they are independent), then check that each output file was created
 
         4. **WAIT FOR EVALUATOR FEEDBACK** - the evaluator will validate your output
 
@@ -1205,7 +1396,7 @@ class StructureGeneratorEvaluatorPair:
            - Save extracted data to: owners/layout_data.json
            - Format: {{"property_[id]": {{layout data following schema}}}}
 
-        4. **TEST ALL UPDATED SCRIPTS** - run them and verify output
+        4. **TEST ALL UPDATED SCRIPTS** - run them together with execute_code_files_concurrently and verify output
 
         🏗️ STRUCTURE DETECTION GUIDELINES:
         Look for information about:
@@ -1256,6 +1447,7 @@ class StructureGeneratorEvaluatorPair:
         }}
         ```
 
+        {GENERATED_SCRIPT_RULES}
         ⚠️ CRITICAL RULES:
         - **CHECK EXISTING SCRIPTS FIRST** before creating new ones
         - **RUN EXISTING SCRIPTS** before updating them
@@ -1269,7 +1461,7 @@ class StructureGeneratorEvaluatorPair:
 
         🚨 WORKFLOW ENFORCEMENT:
         1. **FIRST**: Check all three existing scripts with read_file tool
-        2. **IF EXIST**: Run them with execute_code_file tool
+        2. **IF EXIST**: Run them with ONE execute_code_files_concurrently call
         3. **WAIT**: For evaluator feedback
         4. **IF EVALUATOR REJECTS**: Update specific scripts based on feedback
 
@@ -1279,7 +1471,8 @@ class StructureGeneratorEvaluatorPair:
         return create_react_agent(
             model=self.model,
             tools=self.tools,
-            prompt=generator_prompt,
+            prompt=build_system_prompt(generator_prompt),
+            pre_model_hook=trim_history_hook,
             checkpointer=self.shared_checkpointer
         )
 
@@ -1296,6 +1489,7 @@ class StructureGeneratorEvaluatorPair:
 
         🔍 REASONABLE VALIDATION:
         Check 2-3 sample properties for:
+        {SAMPLE_SELECTION_RULE}
 
         1. **Basic Extraction**: Are structure/utility/layout files created?
         2. **Schema Mapping**: Are available data points mapped to appropriate schema fields?
@@ -1321,13 +1515,14 @@ class StructureGeneratorEvaluatorPair:
         - Focus on major extraction issues, not perfect enum matching
         - Understand that source data quality varies
 
-        RESPONSE: **STATUS: ACCEPTED** or **STATUS: REJECTED** with major issues only.
+        RESPONSE: start your reply with **STATUS: ACCEPTED** or **STATUS: REJECTED**, then list major issues only.
         """
 
         return create_react_agent(
             model=self.model,
             tools=self.tools,
-            prompt=evaluator_prompt,
+            prompt=build_system_prompt(evaluator_prompt),
+            pre_model_hook=trim_history_hook,
             checkpointer=self.shared_checkpointer
         )
 
@@ -1337,8 +1532,8 @@ class StructureGeneratorEvaluatorPair:
         # (Same timeout handling, activity tracking, etc.)
 
         update_agent_activity(self.state)
-        logger.info(f"     🗣️ {agent_name} speaking (Turn {turn})...")
-        logger.info(f"     👀 {agent_name} using shared checkpointer memory")
+        logger.info("     🗣️ %s speaking (Turn %s)...", agent_name, turn)
+        logger.info("     👀 %s using shared checkpointer memory", agent_name)
 
         config = {
             "configurable": {"thread_id": self.shared_thread_id},
@@ -1350,65 +1545,60 @@ class StructureGeneratorEvaluatorPair:
             "content": user_instruction
         }]
 
-        logger.info(f"     📖 {agent_name} using checkpointer memory...")
+        logger.info("     📖 %s using checkpointer memory...", agent_name)
 
         agent_response = ""
-        tool_calls_made = []
+        tool_calls_made = Counter()
+
+        # Checked once per turn; guards the str()/slice work that only feeds log lines
+        log_info = logger.isEnabledFor(logging.INFO)
 
         try:
             timeout_seconds = self.state['agent_timeout_seconds']
-            last_activity = time.time()
-
-            async def check_inactivity():
-                nonlocal last_activity
-                while True:
-                    await asyncio.sleep(10)
-                    current_time = time.time()
-                    if current_time - last_activity > timeout_seconds:
-                        logger.error(f"     ⏰ {agent_name} INACTIVITY TIMEOUT after {timeout_seconds} seconds")
-                        raise asyncio.TimeoutError(f"{agent_name} inactive for {timeout_seconds} seconds")
-
-            inactivity_task = asyncio.create_task(check_inactivity())
+            events = agent.astream_events({"messages": messages}, config, version="v2")
 
             try:
-                async for event in agent.astream_events({"messages": messages}, config, version="v1"):
-                    last_activity = time.time()
+                while True:
+                    # Inactivity timeout: each event must arrive within timeout_seconds of the previous one
+                    try:
+                        event = await asyncio.wait_for(events.__anext__(), timeout=timeout_seconds)
+                    except StopAsyncIteration:
+                        break
                     update_agent_activity(self.state)
 
                     kind = event["event"]
 
-                    if kind == "on_chain_start":
-                        logger.info(f"       🔗 {agent_name} chain starting: {event.get('name', 'unknown')}")
+                    # Token chunks and chain starts are the bulk of the stream and carry nothing we log
+                    if kind == "on_chat_model_stream" or kind == "on_chain_start":
+                        continue
 
-                    elif kind == "on_llm_start":
-                        logger.info(f"       🧠 {agent_name} thinking...")
+                    if kind == "on_chat_model_start" or kind == "on_llm_start":
+                        logger.info("       🧠 %s thinking...", agent_name)
 
-                    elif kind == "on_llm_end":
+                    elif kind == "on_chat_model_end" or kind == "on_llm_end":
                         llm_output = event['data'].get('output', '')
-                        if hasattr(llm_output, 'content'):
-                            content = llm_output.content[:200] + "..." if len(
-                                llm_output.content) > 200 else llm_output.content
-                            logger.info(f"       💭 {agent_name} decided: {content}")
+                        if log_info and hasattr(llm_output, 'content'):
+                            content = log_preview(llm_output, 200)
+                            logger.info("       💭 %s decided: %s", agent_name, content)
 
                     elif kind == "on_tool_start":
                         tool_name = event['name']
-                        tool_input = event['data'].get('input', {})
-                        logger.info(f"       🔧 {agent_name} using tool: {tool_name}")
-                        logger.info(f"       📝 Tool input: {str(tool_input)[:150]}...")
-                        tool_calls_made.append(tool_name)
+                        logger.info("       🔧 %s using tool: %s", agent_name, tool_name)
+                        if log_info:
+                            logger.info("       📝 Tool input: %s", log_preview(event['data'].get('input', {}), 150))
+                        tool_calls_made[tool_name] += 1
 
                     elif kind == "on_tool_end":
-                        tool_name = event['name']
-                        tool_output = event['data'].get('output', '')
-                        success_indicator = "✅" if "error" not in str(tool_output).lower() else "❌"
-
-                        logger.info(f"       {success_indicator} {agent_name} tool {tool_name} completed")
-                        logger.info(f"       📤 Result: {str(tool_output)[:100]}...")
+                        if log_info:
+                            tool_output = event['data'].get('output', '')
+                            success_indicator = "❌" if tool_output_has_error(tool_output) else "✅"
+                            logger.info("       %s %s tool %s completed", success_indicator, agent_name, event['name'])
+                            logger.info("       📤 Result: %s", log_preview(tool_output, 100))
 
                     elif kind == "on_chain_end":
                         chain_name = event.get('name', 'unknown')
                         output = event['data'].get('output', '')
-                        logger.info(f"       🎯 {agent_name} chain completed: {chain_name}")
+                        logger.info("       🎯 %s chain completed: %s", agent_name, chain_name)
 
                         if isinstance(output, dict) and 'messages' in output:
                             last_message = output['messages'][-1] if output['messages'] else None
@@ -1420,28 +1610,43 @@ class StructureGeneratorEvaluatorPair:
                             agent_response = output
 
             finally:
-                inactivity_task.cancel()
-                try:
-                    await inactivity_task
-                except asyncio.CancelledError:
-                    pass
+                await events.aclose()
+                update_agent_activity(self.state)
 
-            logger.info(f"     ✅ {agent_name} finished speaking")
-            logger.info(f"     🔧 Tools used: {', '.join(tool_calls_made) if tool_calls_made else 'None'}")
-            logger.info(f"     📄 Response length: {len(agent_response)} characters")
+            logger.info("     ✅ %s finished speaking", agent_name)
+            logger.info("     🔧 Tools used: %s", dict(tool_calls_made) if tool_calls_made else 'None')
+            logger.info("     📄 Response length: %s characters", len(agent_response))
 
             return agent_response or f"{agent_name} completed turn {turn} (no response captured)"
 
         except asyncio.TimeoutError:
-            logger.error(f"     ⏰ {agent_name} INACTIVITY TIMEOUT after {timeout_seconds} seconds")
-            logger.error(f"     🔄 This will trigger a restart of the structure extraction process")
+            logger.error("     ⏰ %s INACTIVITY TIMEOUT after %s seconds", agent_name, timeout_seconds)
+            logger.error("     🔄 This will trigger a restart of the structure extraction process")
             raise Exception(
                 f"{agent_name} timed out after {timeout_seconds} seconds of inactivity - restarting structure extraction")
         except Exception as e:
-            logger.error(f"     ❌ {agent_name} error: {str(e)}")
+            logger.error("     ❌ %s error: %s", agent_name, e)
             return f"{agent_name} error on turn {turn}: {str(e)}"
 
 
+# "File: submit/property_123/property.json" lines in the CLI's plain-text error output
+_CLI_FILE_LINE_RE = re.compile(r"File:[ \t]*(.*\S)")
+
+
+@functools.lru_cache(maxsize=8)
+def submit_error_folders(path: str, mtime_ns: int, size: int) -> frozenset:
+    """Property folders named in submit_errors.csv, streamed row by row; cached until the file changes"""
+    folders = set()
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            # Extract just the property folder name from the path
+            # e.g., "submit/property_123/property.json" -> "property_123"
+            parts = (row.get('file_path') or '').replace('\\', '/').split('/')
+            if len(parts) >= 2:
+                folders.add(parts[-2])
+    return frozenset(folders)
+
+
 class ExtractionGeneratorEvaluatorPair:
     """Generator and TWO Evaluators for extraction node with schema and data validation"""
 
@@ -1455,6 +1660,16 @@ class ExtractionGeneratorEvaluatorPair:
         self.shared_thread_id = "extraction-conversation-1"  # Same thread for all
         self.consecutive_script_failures = 0
         self.max_script_failures = 3
+        # Compiled once and reused across restarts - a restart only needs a fresh thread
+        self._generator_agent = None
+        self._data_evaluator_agent = None
+
+    async def _get_agents(self):
+        """Compile the generator and data evaluator graphs on first use and return them"""
+        if self._generator_agent is None:
+            self._generator_agent = await self._create_generator_agent()
+            self._data_evaluator_agent = await self._create_data_evaluator_agent()
+        return self._generator_agent, self._data_evaluator_agent
 
     def canonicalize_cli_errors(self, cli_errors: str) -> str:
         """Simple canonicalization: extract file paths and normalize them"""
@@ -1462,95 +1677,83 @@ class ExtractionGeneratorEvaluatorPair:
         # Parse the CLI errors to extract file paths
         error_files = set()
 
-        # Check if submit_errors.csv exists (the actual CLI error format)
-        submit_errors_path = os.path.join(BASE_DIR, "submit_errors.csv")
+        # Check if submit_errors.csv exists (the actual CLI error format) - one stat covers existence and cache key
+        try:
+            stat = os.stat(SUBMIT_ERRORS_PATH)
+        except FileNotFoundError:
+            stat = None
 
-        if os.path.exists(submit_errors_path):
+        if stat is not None:
             try:
-                df = pd.read_csv(submit_errors_path)
-                for _, row in df.iterrows():
-                    file_path = row['file_path']
-                    # Extract just the property folder name from the path
-                    # e.g., "submit/property_123/property.json" -> "property_123"
-                    normalized_path = file_path.replace('\\', '/')
-                    parts = normalized_path.split('/')
-                    if len(parts) >= 2:
-                        property_folder = parts[-2]  # Get the folder name
-                        error_files.add(property_folder)
+                error_files.update(submit_error_folders(SUBMIT_ERRORS_PATH, stat.st_mtime_ns, stat.st_size))
             except Exception as e:
                 logger.warning(f"Could not parse submit_errors.csv: {e}")
 
         # If no CSV, try to extract from error text
         if not error_files:
-            lines = cli_errors.split('\n')
-            for line in lines:
-                if 'File:' in line:
-                    file_path = line.replace('File:', '').strip()
-                    # Extract property folder from path
-                    normalized_path = file_path.replace('\\', '/')
-                    parts = normalized_path.split('/')
-                    if len(parts) >= 2:
-                        property_folder = parts[-2]
-                        error_files.add(property_folder)
-
-        # Sort the property folders for consistent ordering
-        canonical_errors = sorted(list(error_files))
-
-        # Create simple canonical string
-        canonical_string = json.dumps(canonical_errors, sort_keys=True)
-
-        # Return hash
-        return hashlib.md5(canonical_string.encode()).hexdigest()
-
-    def _should_restart_generation(self, current_error_details: str) -> bool:
-        """Check if we should restart based on canonicalized file paths"""
-
-        # Get canonical hash of current errors
-        current_error_hash = self.canonicalize_cli_errors(current_error_details)
-
-        # Check if it's the same as last error
-        if self.state['last_error_hash'] == current_error_hash:
+            for match in _CLI_FILE_LINE_RE.finditer(cli_errors):
+                # Extract property folder from path - only the last two segments matter
+                parts = match.group(1).replace('\\', '/').rsplit('/', 2)
+                if len(parts) >= 2:
+                    error_files.add(parts[-2])
+
+        # No property folders to go on (e.g. auth, network or schema errors) - hash the error text itself instead,
+        # with whitespace collapsed, so different failures never share the empty-set hash
+        if not error_files:
+            return hashlib.blake2b(" ".join(cli_errors.split()).encode(), digest_size=16).hexdigest()
+
+        # Hash the sorted property folders directly, NUL-separated, for a consistent ordering
+        digest = hashlib.blake2b(digest_size=16)
+        for folder in sorted(error_files):
+            digest.update(folder.encode())
+            digest.update(b'\0')
+
+        return digest.hexdigest()
+
+    def _record_error(self, error_details: str, error_hash: str = None) -> tuple:
+        """Hash a CLI error report once (unless already hashed), update the same-error counter and history;
+        return (hash, count)"""
+        if error_hash is None:
+            error_hash = self.canonicalize_cli_errors(error_details)
+
+        if self.state['last_error_hash'] == error_hash:
             self.state['consecutive_same_errors'] += 1
         else:
             self.state['consecutive_same_errors'] = 1
-            self.state['last_error_hash'] = current_error_hash
+            self.state['last_error_hash'] = error_hash
+
+        # Keep history of recent errors - the deque drops the oldest entry itself
+        self.state['error_history'].append(error_details)
+
+        return error_hash, self.state['consecutive_same_errors']
+
+    def _should_restart_generation(self, current_error_details: str, current_error_hash: str = None) -> bool:
+        """Record the current CLI errors and check if we should restart based on canonicalized file paths"""
+        current_error_hash, same_error_count = self._record_error(current_error_details, current_error_hash)
 
         # Log for debugging
         logger.info(f"🔍 Canonical error hash: {current_error_hash}")
-        logger.info(f"🔢 Consecutive same errors: {self.state['consecutive_same_errors']}")
+        logger.info(f"🔢 Consecutive same errors: {same_error_count}")
 
         # Restart after 3 consecutive same errors
-        if (self.state['consecutive_same_errors'] > 4 and
+        if (same_error_count > 4 and
                 self.state['generation_restart_count'] < self.state['max_generation_restarts']):
-            logger.warning(f"🔄 Same file path errors detected {self.state['consecutive_same_errors']} times")
+            logger.warning(f"🔄 Same file path errors detected {same_error_count} times")
             return True
 
         return False
 
-    def _update_error_tracking(self, error_hash: str, error_details: str):
-        """Update error tracking state"""
-        if self.state['last_error_hash'] == error_hash:
-            self.state['consecutive_same_errors'] += 1
-        else:
-            self.state['consecutive_same_errors'] = 1
-            self.state['last_error_hash'] = error_hash
-
-        # Keep history of recent errors (last 10)
-        self.state['error_history'].append(error_details)
-        if len(self.state['error_history']) > 10:
-            self.state['error_history'] = self.state['error_history'][-10:]
-
-    async def _restart_generation_process(self) -> WorkflowState:
-        """Restart the generation process with a fresh thread"""
-        logger.info("🔄 RESTARTING GENERATION PROCESS - Creating new thread and agents")
+    def _restart_generation_process(self):
+        """Reset for a fresh attempt on a new thread"""
+        logger.info("🔄 RESTARTING GENERATION PROCESS - Creating new thread")
 
         self.state['last_agent_activity'] = 0
         # Increment restart counter
         self.state['generation_restart_count'] += 1
 
-        # Create new thread ID for fresh start
+        # New thread ID gives the reused agents an empty conversation; the old one is no longer needed
+        release_thread_checkpoints(self.shared_checkpointer, self.shared_thread_id)
         self.shared_thread_id = f"extraction-conversation-restart-{self.state['generation_restart_count']}"
-        self.shared_checkpointer = InMemorySaver()  # Fresh checkpointer
 
         # Reset conversation state
         self.max_conversation_turns = 20  # Reset turn counter
@@ -1562,10 +1765,15 @@ class ExtractionGeneratorEvaluatorPair:
         logger.info(f"🆕 Starting fresh generation attempt #{self.state['generation_restart_count']}")
         logger.info(f"🆕 New thread ID: {self.shared_thread_id}")
 
-        # Start the conversation loop again from the beginning
-        return await self.run_feedback_loop()
-
     async def run_feedback_loop(self) -> WorkflowState:
+        """Run the Generator + Data Evaluator + CLI Validator conversation, restarting on a fresh thread when needed"""
+        # Iterate instead of recursing so repeated restarts don't stack feedback loops
+        while await self._run_conversation():
+            self._restart_generation_process()
+        return self.state
+
+    async def _run_conversation(self) -> bool:
+        """Run one conversation (with hang recovery) on the current thread; returns True if it must be restarted"""
         logger.info("🔄 Starting Generator + Data Evaluator + CLI Validator CONVERSATION WITH HANG RECOVERY")
         logger.info(f"💬 Using shared thread: {self.shared_thread_id}")
         logger.info(f"🎭 Agents: Generator, Data Evaluator, CLI Validator")
@@ -1575,9 +1783,7 @@ class ExtractionGeneratorEvaluatorPair:
 
         while hang_recovery_count <= max_hang_recoveries:
             try:
-                # Create agents (YOUR ORIGINAL CODE)
-                generator_agent = await self._create_generator_agent()
-                data_evaluator_agent = await self._create_data_evaluator_agent()
+                generator_agent, data_evaluator_agent = await self._get_agents()
 
                 conversation_turn = 0
                 data_accepted = False
@@ -1600,44 +1806,60 @@ class ExtractionGeneratorEvaluatorPair:
                     if hasattr(self, 'force_restart_now') and self.force_restart_now:
                         logger.warning("🔄 Script failure restart triggered - restarting now")
                         self.force_restart_now = False
-                        return await self._restart_generation_process()
+                        return True
 
                     if should_restart_due_to_timeout(self.state):
                         logger.warning("⏰ Agent timeout detected - restarting generation process")
-                        return await self._restart_generation_process()
+                        return True
 
                     logger.info(f"💬 Conversation Turn {conversation_turn}/{self.max_conversation_turns}")
 
-                    # DATA EVALUATOR RESPONDS (YOUR ORIGINAL CODE - RESTORED!)
-                    logger.info("📊 Data Evaluator reviews Generator's work...")
-                    try:
-                        data_message = await self._agent_speak_with_hang_detection(  # ONLY CHANGE: Added hang detection
-                            agent=data_evaluator_agent,
-                            agent_name="DATA_EVALUATOR",
-                            turn=conversation_turn,
-                            user_instruction="""
-                            you are a restrict reviewer, you have a checklist , you have to make sure every single point in this check list is correct,
-                              your job is to Review and evaluate the Generator's extraction work all over Again even if you already accepted it in previous run"
-                              validate data completeness by comparing with sample input files and make sure validation points are met, pick AT MOST 3 different samples to compare,
-                              DO NOT repeat yourself, if generator persisted in an output makesure you are correct and revalidate yourself
-                              if you already accepted in the previous run, check again for any new issues that might have been introduced by the generator
-                              if REJECTED, REPLY ONLY WITH AN ACTION PLAN FOR THE GENERATOR TO DO AS STEPS TO FIX THE ISSUES
-                             """,
-                        )
-                    except Exception as e:
-                        if "timed out" in str(e) or "hang" in str(e).lower():
-                            logger.warning("⏰ Agent timeout/hang during DATA_EVALUATOR - triggering hang recovery")
-                            raise HangRecoveryException(f"DATA_EVALUATOR hang: {str(e)}")
-                        raise
-
-                    data_accepted = "STATUS: ACCEPTED" in data_message
-                    logger.info(f"📊 Data Evaluator decision: {'ACCEPTED' if data_accepted else 'NEEDS FIXES'}")
-
-                    # CLI VALIDATOR RUNS (YOUR ORIGINAL CODE)
+                    # CLI VALIDATOR finishes before the Data Evaluator speaks - it writes seed fields, relationship
+                    # and county group files into ./data/, which the evaluator reads. The thread keeps the loop free
                     logger.info("⚡ CLI Validator running validation...")
-                    cli_success, cli_errors, _ = run_cli_validator("data", self.state['county_data_group_cid'])
-
-                    print(f"🔍 CLI Validator errors: {cli_errors}")
+                    cli_success, cli_errors, _ = await asyncio.to_thread(
+                        run_cli_validator, "data", self.state['county_data_group_cid'])
+
+                    # Hashed once here, before _should_restart_generation records it, so it can be compared with
+                    # the previous turn's failure
+                    cli_error_hash = None if cli_success else self.canonicalize_cli_errors(cli_errors)
+
+                    # The exact same CLI failure again: skip the LLM review until the generator fixes it
+                    skip_data_evaluator = (cli_error_hash is not None
+                                           and self.state['consecutive_same_errors'] >= 2
+                                           and cli_error_hash == self.state['last_error_hash'])
+
+                    if skip_data_evaluator:
+                        logger.info("⏭️ CLI still failing on the same files - skipping the Data Evaluator this turn")
+                        data_message = "Data review skipped this turn - fix the CLI validation errors first"
+                        data_accepted = False
+                    else:
+                        # DATA EVALUATOR RESPONDS (YOUR ORIGINAL CODE - RESTORED!)
+                        logger.info("📊 Data Evaluator reviews Generator's work...")
+                        try:
+                            data_message = await self._agent_speak_with_hang_detection(  # ONLY CHANGE: Added hang detection
+                                agent=data_evaluator_agent,
+                                agent_name="DATA_EVALUATOR",
+                                turn=conversation_turn,
+                                user_instruction="""
+                                you are a restrict reviewer, you have a checklist , you have to make sure every single point in this check list is correct,
+                                  your job is to Review and evaluate the Generator's extraction work all over Again even if you already accepted it in previous run"
+                                  validate data completeness by comparing with sample input files and make sure validation points are met, pick AT MOST 3 different samples to compare,
+                                  DO NOT repeat yourself, if generator persisted in an output makesure you are correct and revalidate yourself
+                                  if you already accepted in the previous run, check again for any new issues that might have been introduced by the generator
+                                  if REJECTED, REPLY ONLY WITH AN ACTION PLAN FOR THE GENERATOR TO DO AS STEPS TO FIX THE ISSUES
+                                 """,
+                            )
+                        except Exception as e:
+                            if "timed out" in str(e) or "hang" in str(e).lower():
+                                logger.warning("⏰ Agent timeout/hang during DATA_EVALUATOR - triggering hang recovery")
+                                raise HangRecoveryException(f"DATA_EVALUATOR hang: {str(e)}")
+                            raise
+
+                        data_accepted = is_status_accepted(data_message)
+                        logger.info(f"📊 Data Evaluator decision: {'ACCEPTED' if data_accepted else 'NEEDS FIXES'}")
+
+                    logger.debug("🔍 CLI Validator errors: %s", cli_errors)
                     if cli_success:
                         cli_message = "STATUS: ACCEPTED - CLI validation passed successfully"
                         cli_accepted = True
@@ -1649,9 +1871,9 @@ class ExtractionGeneratorEvaluatorPair:
                         cli_accepted = False
 
                         # Check if we should restart due to repeated file path errors (YOUR ORIGINAL CODE)
-                        if self._should_restart_generation(cli_errors):
+                        if self._should_restart_generation(cli_errors, cli_error_hash):
                             logger.warning("🔄 Same file path errors detected 3 times - restarting generation process")
-                            return await self._restart_generation_process()
+                            return True
 
                         logger.info("❌ CLI Validator decision: NEEDS FIXES")
 
@@ -1660,18 +1882,19 @@ class ExtractionGeneratorEvaluatorPair:
                         logger.info("✅ Conversation completed successfully - ALL validators approved!")
                         self.state['extraction_complete'] = True
                         self.state['all_files_processed'] = True
-                        return self.state  # SUCCESS - EXIT HANG RECOVERY LOOP
+                        return False  # SUCCESS - EXIT HANG RECOVERY LOOP
 
                     # GENERATOR RESPONDS (YOUR ORIGINAL CODE)
                     logger.info("🤖 Generator responds to all validators' feedback...")
 
-                    feedback_summary = ""
+                    feedback_parts = []
                     if not data_accepted:
-                        feedback_summary += f"Data Evaluator feedback: {data_message}\n\n"
+                        feedback_parts.append(f"Data Evaluator feedback: {data_message}")
                     if not cli_accepted:
-                        feedback_summary += f"CLI Validator feedback: {cli_message}\n\n"
+                        feedback_parts.append(f"CLI Validator feedback: {cli_message}")
+                    feedback_summary = "\n\n".join(feedback_parts)
 
-                    print(f"🔍 Feedback summary for generator:{feedback_summary}")
+                    logger.debug("🔍 Feedback summary for generator:%s", feedback_summary)
                     await self._agent_speak_with_hang_detection(  # ONLY CHANGE: Added hang detection
                         agent=generator_agent,
                         agent_name="GENERATOR",
@@ -1703,7 +1926,7 @@ class ExtractionGeneratorEvaluatorPair:
                     self.state['all_files_processed'] = False
 
                 logger.info(f"💬 Conversation completed with status: {final_status}")
-                return self.state  # SUCCESS - EXIT HANG RECOVERY LOOP
+                return False  # SUCCESS - EXIT HANG RECOVERY LOOP
 
             except HangRecoveryException as e:
                 # HANG RECOVERY LOGIC
@@ -1724,8 +1947,8 @@ class ExtractionGeneratorEvaluatorPair:
                 await asyncio.sleep(backoff_time)
 
                 # Reset state for retry
+                release_thread_checkpoints(self.shared_checkpointer, self.shared_thread_id)
                 self.shared_thread_id = f"conversation-recovery-{hang_recovery_count}-{int(time.time())}"
-                self.shared_checkpointer = InMemorySaver()
 
                 logger.info(f"🚀 HANG RECOVERY RETRY #{hang_recovery_count}")
                 continue  # RETRY THE WHOLE CONVERSATION
@@ -1741,13 +1964,13 @@ class ExtractionGeneratorEvaluatorPair:
 
         # If we get here, all hang recoveries failed
         logger.error("💥 ALL HANG RECOVERIES FAILED")
-        return self.state
+        return False
 
     async def _agent_speak_with_hang_detection(self, agent, agent_name: str, turn: int, user_instruction: str) -> str:
         """Wrapper that adds hang detection to your existing _agent_speak method"""
 
         # Create hang detector for this specific agent call
-        hang_detector = HangDetector(timeout_seconds=120, check_interval=5)
+        hang_detector = HangDetector(timeout_seconds=120)
 
         try:
             # Start monitoring
@@ -1807,7 +2030,9 @@ class ExtractionGeneratorEvaluatorPair:
             2. **ANALYZE INPUT STRUCTURE** (examine 3-5 sample files)
             3. **ANALYZE SUPPORTING DATA**:
                - owners/owners_schema.json (for person/company data)
-               - seed.csv (for address extraction)
+               - seed.csv (for address extraction) - load it ONCE at script start, only the columns you need, e.g.
+                 `pd.read_csv('seed.csv', usecols=['parcel_id', 'address', 'county'], dtype='string')`
+                 and build a `parcel_id -> row` dict; do NOT re-read seed.csv per property
                - owners/layout_data.json, owners/structure_data.json, owners/utility_data.json
             4. **CREATE or UPDATE** scripts/data_extractor.py that generates output structure below
 
@@ -1869,6 +2094,9 @@ class ExtractionGeneratorEvaluatorPair:
                 - street_post_directional_text
                 - street_pre_directional_text
                 - street_suffix_type
+              Parse them with module-level constants, not per-address regex compiles:
+              `_SUFFIX_RE = re.compile(r"\\b(ST|AVE|BLVD|RD|DR|LN|CT|PL|WAY|PKWY)\\b", re.I)`,
+              `_SUFFIX_MAP = {{"STREET": "ST", "AVENUE": "AVE", ...}}`, `_DIR_MAP = {{"NORTH": "N", ...}}`
 
             📋 SCHEMAS TO FOLLOW:
             All schemas are available in the ./schemas/ directory. Read each schema file to understand the required structure, you MUST follow the exact structure provided in the schemas.
@@ -1879,11 +2107,13 @@ class ExtractionGeneratorEvaluatorPair:
             3. Analyze the owners data from owners/owners_schema.json to understand how to extract person/company data
             4. Analyze the address structure in the seed.csv to use in extraction process
             4. Generate a universal extraction script: `scripts/data_extractor.py` that Map input data to the schemas, and save the extracted data as JSON files in the `data` folder.
+               Write each property's files as soon as that property is processed - do NOT collect every property's output in one big dict and dump it at the end.
             5. The script MUST be execeutable and you MUST NOT QUITE until the script is executed successfully with No errors
             6. Execute the script to process ALL input files
             7. MAKE SURE script is executable and can be run without errors
             8. data could have Either persons or company, but not both, if persons is present then company should be null and vice versa
 
+            {GENERATED_SCRIPT_RULES}
             ⚠️ CRITICAL RULES:
             - Process 10 input file in ./input/ directory
             - Follow the exact schema structure provided
@@ -1907,7 +2137,8 @@ class ExtractionGeneratorEvaluatorPair:
         return create_react_agent(
             model=self.model,
             tools=self.tools,
-            prompt=generator_prompt,
+            prompt=build_system_prompt(generator_prompt),
+            pre_model_hook=trim_history_hook,
             checkpointer=self.shared_checkpointer
         )
 
@@ -1924,6 +2155,7 @@ class ExtractionGeneratorEvaluatorPair:
 
             STEP 1: **YOU PERSONALLY EXAMINE THE DATA**
             1. **Read AT MOST 3 sample input files** from ./input/ directory yourself
+               {SAMPLE_SELECTION_RULE}
             2. **Read the corresponding output folders** in ./data/ directory yourself  
             3. **Compare them side-by-side** yourself
             4. **Count and verify** the data yourself
@@ -2023,7 +2255,8 @@ class ExtractionGeneratorEvaluatorPair:
         return create_react_agent(
             model=self.model,
             tools=self.tools,
-            prompt=data_evaluator_prompt,
+            prompt=build_system_prompt(data_evaluator_prompt),
+            pre_model_hook=trim_history_hook,
             checkpointer=self.shared_checkpointer
         )
 
@@ -2035,8 +2268,8 @@ class ExtractionGeneratorEvaluatorPair:
 
         # YOUR ORIGINAL CODE - UNCHANGED
         update_agent_activity(self.state)
-        logger.info(f"     🗣️ {agent_name} speaking (Turn {turn})...")
-        logger.info(f"     👀 {agent_name} using shared checkpointer memory")
+        logger.info("     🗣️ %s speaking (Turn %s)...", agent_name, turn)
+        logger.info("     👀 %s using shared checkpointer memory", agent_name)
 
         config = {
             "configurable": {"thread_id": self.shared_thread_id},
@@ -2048,39 +2281,35 @@ class ExtractionGeneratorEvaluatorPair:
             "content": user_instruction
         }]
 
-        logger.info(f"     📖 {agent_name} using checkpointer memory...")
+        logger.info("     📖 %s using checkpointer memory...", agent_name)
 
         agent_response = ""
-        tool_calls_made = []
+        tool_calls_made = Counter()
+
+        # Checked once per turn; guards the str()/slice work that only feeds log lines
+        log_info = logger.isEnabledFor(logging.INFO)
 
         try:
             timeout_seconds = self.state['agent_timeout_seconds']
-            last_activity = time.time()
-
-            async def check_inactivity():
-                nonlocal last_activity
-                while True:
-                    await asyncio.sleep(10)
-                    current_time = time.time()
-                    if current_time - last_activity > timeout_seconds:
-                        logger.error(f"     ⏰ {agent_name} INACTIVITY TIMEOUT after {timeout_seconds} seconds")
-                        raise asyncio.TimeoutError(f"{agent_name} inactive for {timeout_seconds} seconds")
-
-            inactivity_task = asyncio.create_task(check_inactivity())
+            events = agent.astream_events({"messages": messages}, config, version="v2")
 
             try:
                 streaming_event_count = 0
                 max_streaming_events = 5000
 
-                async for event in agent.astream_events({"messages": messages}, config, version="v1"):
-                    last_activity = time.time()
+                while True:
+                    # Inactivity timeout: each event must arrive within timeout_seconds of the previous one
+                    try:
+                        event = await asyncio.wait_for(events.__anext__(), timeout=timeout_seconds)
+                    except StopAsyncIteration:
+                        break
                     update_agent_activity(self.state)
 
                     if event["event"] == "on_chat_model_stream":
                         streaming_event_count += 1
                         if streaming_event_count > max_streaming_events:
                             logger.error(
-                                f"       🛑 {agent_name} EXCESSIVE STREAMING - stopping after {streaming_event_count} events")
+                                "       🛑 %s EXCESSIVE STREAMING - stopping after %s events", agent_name, streaming_event_count)
                             break
 
                             # UPDATE HANG DETECTOR WITH ACTIVITY
@@ -2089,53 +2318,55 @@ class ExtractionGeneratorEvaluatorPair:
                     kind = event["event"]
 
                     # YOUR ORIGINAL EVENT HANDLING CODE - UNCHANGED
-                    if kind == "on_chain_start":
-                        logger.info(f"       🔗 {agent_name} chain starting: {event.get('name', 'unknown')}")
+                    # Token chunks and chain starts are the bulk of the stream and carry nothing we log
+                    if kind == "on_chat_model_stream" or kind == "on_chain_start":
+                        continue
 
-                    elif kind == "on_llm_start":
-                        logger.info(f"       🧠 {agent_name} thinking...")
+                    if kind == "on_chat_model_start" or kind == "on_llm_start":
+                        logger.info("       🧠 %s thinking...", agent_name)
 
-                    elif kind == "on_llm_end":
+                    elif kind == "on_chat_model_end" or kind == "on_llm_end":
                         llm_output = event['data'].get('output', '')
-                        if hasattr(llm_output, 'content'):
-                            content = llm_output.content[:200] + "..." if len(
-                                llm_output.content) > 200 else llm_output.content
-                            logger.info(f"       💭 {agent_name} decided: {content}")
+                        if log_info and hasattr(llm_output, 'content'):
+                            content = log_preview(llm_output, 200)
+                            logger.info("       💭 %s decided: %s", agent_name, content)
 
                     elif kind == "on_tool_start":
                         tool_name = event['name']
-                        tool_input = event['data'].get('input', {})
-                        logger.info(f"       🔧 {agent_name} using tool: {tool_name}")
-                        logger.info(f"       📝 Tool input: {str(tool_input)[:150]}...")
-                        tool_calls_made.append(tool_name)
+                        logger.info("       🔧 %s using tool: %s", agent_name, tool_name)
+                        if log_info:
+                            logger.info("       📝 Tool input: %s", log_preview(event['data'].get('input', {}), 150))
+                        tool_calls_made[tool_name] += 1
 
                     elif kind == "on_tool_end":
                         tool_name = event['name']
                         tool_output = event['data'].get('output', '')
-                        success_indicator = "✅" if "error" not in str(tool_output).lower() else "❌"
+                        tool_failed = tool_output_has_error(tool_output)
+                        success_indicator = "❌" if tool_failed else "✅"
 
                         if tool_name == "execute_code_file":
-                            if "error" in str(tool_output).lower():
+                            if tool_failed:
                                 self.consecutive_script_failures += 1
                                 logger.warning(
-                                    f"       ❌ Script execution failed ({self.consecutive_script_failures}/{self.max_script_failures})")
+                                    "       ❌ Script execution failed (%s/%s)", self.consecutive_script_failures, self.max_script_failures)
 
                                 if self.consecutive_script_failures >= self.max_script_failures:
                                     logger.error(
-                                        f"       🔄 Script failed {self.max_script_failures} times - triggering restart")
+                                        "       🔄 Script failed %s times - triggering restart", self.max_script_failures)
                                     self.force_restart_now = True
                                     return "RESTART_TRIGGERED"
                             else:
                                 self.consecutive_script_failures = 0
-                                logger.info(f"       ✅ Script executed successfully - reset failure counter")
+                                logger.info("       ✅ Script executed successfully - reset failure counter")
 
-                        logger.info(f"       {success_indicator} {agent_name} tool {tool_name} completed")
-                        logger.info(f"       📤 Result: {str(tool_output)[:100]}...")
+                        logger.info("       %s %s tool %s completed", success_indicator, agent_name, tool_name)
+                        if log_info:
+                            logger.info("       📤 Result: %s", log_preview(tool_output, 100))
 
                     elif kind == "on_chain_end":
                         chain_name = event.get('name', 'unknown')
                         output = event['data'].get('output', '')
-                        logger.info(f"       🎯 {agent_name} chain completed: {chain_name}")
+                        logger.info("       🎯 %s chain completed: %s", agent_name, chain_name)
 
                         if isinstance(output, dict) and 'messages' in output:
                             last_message = output['messages'][-1] if output['messages'] else None
@@ -2147,51 +2378,152 @@ class ExtractionGeneratorEvaluatorPair:
                             agent_response = output
 
             finally:
-                inactivity_task.cancel()
-                try:
-                    await inactivity_task
-                except asyncio.CancelledError:
-                    pass
+                await events.aclose()
+                update_agent_activity(self.state)
 
-            logger.info(f"     ✅ {agent_name} finished speaking")
-            logger.info(f"     🔧 Tools used: {', '.join(tool_calls_made) if tool_calls_made else 'None'}")
-            logger.info(f"     📄 Response length: {len(agent_response)} characters")
+            logger.info("     ✅ %s finished speaking", agent_name)
+            logger.info("     🔧 Tools used: %s", dict(tool_calls_made) if tool_calls_made else 'None')
+            logger.info("     📄 Response length: %s characters", len(agent_response))
 
             return agent_response or f"{agent_name} completed turn {turn} (no response captured)"
 
         except asyncio.TimeoutError:
-            logger.error(f"     ⏰ {agent_name} INACTIVITY TIMEOUT after {timeout_seconds} seconds")
-            logger.error(f"     🔄 This will trigger a hang recovery")
+            logger.error("     ⏰ %s INACTIVITY TIMEOUT after %s seconds", agent_name, timeout_seconds)
+            logger.error("     🔄 This will trigger a hang recovery")
             raise Exception(f"{agent_name} timed out after {timeout_seconds} seconds of inactivity")
         except Exception as e:
-            logger.error(f"     ❌ {agent_name} error: {str(e)}")
+            logger.error("     ❌ %s error: %s", agent_name, e)
             return f"{agent_name} error on turn {turn}: {str(e)}"
 
 
 
-def fetch_schema_from_ipfs(cid):
-    """Fetch schema from IPFS using the provided CID."""
-    gateways = [
-        "https://ipfs.io/ipfs/",
-        "https://gateway.pinata.cloud/ipfs/",
-        "https://cloudflare-ipfs.com/ipfs/",
-        "https://dweb.link/ipfs/",
-        "https://ipfs.infura.io/ipfs/"
-    ]
+# One pooled session for all gateway requests so schema fetches reuse TCP/TLS connections
+_HTTP_SESSION = requests.Session()
+# Schemas are fetched concurrently, so allow more pooled connections per host than the default 10.
+# Failed connects are retried on the pool; read timeouts are not, so each request stays bounded by GATEWAY_TIMEOUT
+_HTTP_SESSION.mount("https://", requests.adapters.HTTPAdapter(
+    pool_connections=8, pool_maxsize=32, max_retries=Retry(connect=2, read=0, backoff_factor=0.5)))
+
+
+IPFS_GATEWAYS = [
+    "https://ipfs.io/ipfs/",
+    "https://gateway.pinata.cloud/ipfs/",
+    "https://cloudflare-ipfs.com/ipfs/",
+    "https://dweb.link/ipfs/",
+    "https://ipfs.infura.io/ipfs/"
+]
+
+
+# (connect, read) timeout in seconds for one gateway request
+GATEWAY_TIMEOUT = (3.05, 10)
+# How long a gateway gets to answer before the next one is also asked
+GATEWAY_HEDGE_DELAY = 2.0
+
+
+def cid_matches_content(cid: str, data: bytes) -> bool:
+    """Check raw bytes against a base32 CIDv1 with a sha2-256 multihash (the bafkrei... form of SCHEMA_CIDS)"""
+    if not cid.startswith("b"):
+        return False
+    encoded = cid[1:].upper()
+    try:
+        decoded = base64.b32decode(encoded + "=" * (-len(encoded) % 8))
+    except ValueError:
+        return False
+    # <version 0x01><codec varint><multihash code 0x12 = sha2-256><digest length 0x20><digest>
+    if len(decoded) < 4 or decoded[0] != 0x01:
+        return False
+    codec_end = 2 if decoded[1] < 0x80 else 3  # dag-pb (0x70) and raw (0x55) are one byte; dag-json etc. two
+    multihash = decoded[codec_end:]
+    if multihash[:2] != b"\x12\x20" or len(multihash) != 34:
+        return False
+    return hashlib.sha256(data).digest() == multihash[2:]
+
+
+def _fetch_from_gateway(gateway, cid):
+    """Fetch one schema document from one gateway, returning (raw bytes, parsed schema)"""
+    url = f"{gateway}{cid}"
+    logger.info(f"Trying to fetch {cid} from {gateway}")
+    response = _HTTP_SESSION.get(url, timeout=GATEWAY_TIMEOUT)
+    response.raise_for_status()
+    raw = response.content
+    # Verify and parse here so a gateway serving wrong or garbage content doesn't win the race
+    if not cid_matches_content(cid, raw):
+        raise ValueError(f"content from {gateway} does not match CID {cid}")
+    return raw, json_loads(raw)
 
-    for gateway in gateways:
-        try:
-            url = f"{gateway}{cid}"
-            logger.info(f"Trying to fetch {cid} from {gateway}")
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.warning(f"Error fetching from {gateway}: {e}")
-            continue
+
+def fetch_schema_document_from_ipfs(cid):
+    """Fetch schema from IPFS, returning (raw bytes as served, parsed schema) or (None, None).
+
+    Hedged requests: gateways are asked in order, and the next one is only started when the ones in
+    flight have failed or stayed silent for GATEWAY_HEDGE_DELAY. The first valid document wins.
+    """
+    executor = ThreadPoolExecutor(max_workers=len(IPFS_GATEWAYS))
+    gateways = iter(IPFS_GATEWAYS)
+    in_flight = {}
+    try:
+        while True:
+            gateway = next(gateways, None)
+            if gateway is not None:
+                in_flight[executor.submit(_fetch_from_gateway, gateway, cid)] = gateway
+            elif not in_flight:
+                break
+            # Once every gateway has been asked, just wait for the next answer
+            done, _ = wait(in_flight, timeout=GATEWAY_HEDGE_DELAY if gateway is not None else None,
+                           return_when=FIRST_COMPLETED)
+            for future in done:
+                failed_gateway = in_flight.pop(future)
+                try:
+                    return future.result()
+                except Exception as e:
+                    logger.warning(f"Error fetching from {failed_gateway}: {e}")
+    finally:
+        # Slower gateways still in flight finish within GATEWAY_TIMEOUT; don't block on them
+        executor.shutdown(wait=False, cancel_futures=True)
 
     logger.error(f"Failed to fetch schema from IPFS CID {cid} from all gateways")
-    return None
+    return None, None
+
+
+@functools.lru_cache(maxsize=None)
+def load_schema(cid: str) -> bytes:
+    """Return the raw schema document for a CID, from the on-disk cache when available.
+
+    Cache entries are checked against the CID's sha2-256 digest on read and before they are written.
+    """
+    cache_path = os.path.join(SCHEMA_CACHE_DIR, cid)
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = f.read()
+    except FileNotFoundError:
+        cached = None
+    if cached is not None:
+        if cid_matches_content(cid, cached):
+            return cached
+        logger.warning(f"Cached schema {cid} does not match its CID - discarding it")
+        try:
+            os.remove(cache_path)
+        except FileNotFoundError:
+            pass
+
+    raw, _ = fetch_schema_document_from_ipfs(cid)
+    if raw is None:
+        raise ConnectionError(f"Could not fetch schema {cid} from any IPFS gateway")
+    if not cid_matches_content(cid, raw):
+        raise ConnectionError(f"Schema fetched for {cid} does not match its CID")
+
+    # Write atomically so an interrupted run never leaves a truncated cache entry
+    os.makedirs(SCHEMA_CACHE_DIR, exist_ok=True)
+    write_bytes_atomic(cache_path, raw)
+    return raw
+
+
+def fetch_schema_from_ipfs(cid):
+    """Fetch schema from IPFS using the provided CID."""
+    try:
+        return json_loads(load_schema(cid))
+    except ConnectionError:
+        return None
 
 
 # Commented out - not needed for transform workflow
@@ -2210,6 +2542,13 @@ def fetch_county_data_group_cid():
     raise NotImplementedError("fetch_county_data_group_cid is not available in transform mode")
 
 
+# JSON file path -> (ino, mtime_ns, size, seed signature) recorded after the file was last stamped with seed data.
+# The inode makes a file deleted and rebuilt (e.g. a fresh data/ folder in a later run) count as changed
+_SEEDED_FILES: Dict[str, tuple] = {}
+# County data group file path -> (ino, mtime_ns, size, relationship files signature) recorded when it was last written
+_COUNTY_GROUP_FILES: Dict[str, tuple] = {}
+
+
 def prepare_data_for_submission(data_dir: str = "data", county_data_group_cid: str = None) -> tuple[bool, str, str]:
     """
     Prepare data by extending the data directory with:
@@ -2240,8 +2579,8 @@ def prepare_data_for_submission(data_dir: str = "data", county_data_group_cid: s
 
         if os.path.exists(unnormalized_address_path):
             try:
-                with open(unnormalized_address_path, 'r', encoding='utf-8') as f:
-                    address_data = json.load(f)
+                with open(unnormalized_address_path, 'rb') as f:
+                    address_data = json_loads(f.read())
                 logger.info("✅ Found unnormalized_address.json")
 
                 request_identifier = address_data.get('request_identifier')
@@ -2257,15 +2596,16 @@ def prepare_data_for_submission(data_dir: str = "data", county_data_group_cid: s
 
                     # ALSO: Try to determine the folder name from the data directory and map it too
                     if os.path.exists(data_dir_path):
-                        for folder_name in os.listdir(data_dir_path):
-                            if os.path.isdir(os.path.join(data_dir_path, folder_name)):
-                                # Map the folder name to the same seed data
-                                seed_data[folder_name] = {
-                                    "source_http_request": source_http_request,
-                                    "source_identifier": request_identifier
-                                }
-                                logger.info(f"✅ ALSO mapped folder name: {folder_name} -> same seed data")
-                                break
+                        with os.scandir(data_dir_path) as entries:
+                            for entry in entries:
+                                if entry.is_dir():
+                                    # Map the folder name to the same seed data
+                                    seed_data[entry.name] = {
+                                        "source_http_request": source_http_request,
+                                        "source_identifier": request_identifier
+                                    }
+                                    logger.info(f"✅ ALSO mapped folder name: {entry.name} -> same seed data")
+                                    break
 
                     logger.info(f"📋 Source HTTP request: {source_http_request}")
             except Exception as e:
@@ -2285,69 +2625,98 @@ def prepare_data_for_submission(data_dir: str = "data", county_data_group_cid: s
         # Collect all relationship building errors
         all_relationship_errors = []
 
-        for folder_name in os.listdir(data_dir_path):
-            folder_path = os.path.join(data_dir_path, folder_name)
-
-            if os.path.isdir(folder_path):
-                logger.info(f"   📂 Processing folder: {folder_name}")
-                processed_count += 1
-
-                # Update JSON files with seed data (folder_name is the original parcel_id)
-                if folder_name in seed_data:
-                    updated_files_count = 0
-                    for file_name in os.listdir(folder_path):
-                        if file_name.endswith('.json'):
-                            json_file_path = os.path.join(folder_path, file_name)
-
-                            if "relation" in file_name.lower():
-                                logger.info(f"   🔗 Skipping relationship file: {file_name}")
+        # scandir entries carry their file type, so no extra stat per folder
+        with os.scandir(data_dir_path) as entries:
+            folder_entries = [e for e in entries if e.is_dir()]
+
+        for folder_entry in folder_entries:
+            folder_name, folder_path = folder_entry.name, folder_entry.path
+
+            logger.info(f"   📂 Processing folder: {folder_name}")
+            processed_count += 1
+
+            # Update JSON files with seed data (folder_name is the original parcel_id)
+            if folder_name in seed_data:
+                updated_files_count = 0
+                folder_seed = seed_data[folder_name]
+                seed_sig = hashlib.blake2b(
+                    json_dumps([folder_seed['source_http_request'], str(folder_seed['source_identifier'])],
+                               sort_keys=True),
+                    digest_size=8).digest()
+                for file_name in os.listdir(folder_path):
+                    if file_name.endswith('.json'):
+                        json_file_path = os.path.join(folder_path, file_name)
+
+                        if "relation" in file_name.lower():
+                            logger.info(f"   🔗 Skipping relationship file: {file_name}")
+                            continue
+
+                        try:
+                            # Skip files that are untouched since they were stamped with this same seed data
+                            stat = os.stat(json_file_path)
+                            if _SEEDED_FILES.get(json_file_path) == (stat.st_ino, stat.st_mtime_ns, stat.st_size, seed_sig):
                                 continue
 
-                            try:
-                                # Read JSON file
-                                with open(json_file_path, 'r', encoding='utf-8') as f:
-                                    json_data = json.load(f)
+                            # Read JSON file
+                            with open(json_file_path, 'rb') as f:
+                                json_data = json_loads(f.read())
 
-                                # Add seed data fields if not already present
-                                if 'source_http_request' not in json_data:
-                                    json_data['source_http_request'] = seed_data[folder_name]['source_http_request']
-                                if 'request_identifier' not in json_data:
-                                    json_data['request_identifier'] = str(seed_data[folder_name]['source_identifier'])
+                            # Add seed data fields if not already present
+                            if 'source_http_request' not in json_data or 'request_identifier' not in json_data:
+                                json_data.setdefault('source_http_request', folder_seed['source_http_request'])
+                                json_data.setdefault('request_identifier', str(folder_seed['source_identifier']))
 
                                 # Write back to file
-                                with open(json_file_path, 'w', encoding='utf-8') as f:
-                                    json.dump(json_data, f, indent=2, ensure_ascii=False)
+                                write_bytes_atomic(json_file_path, json_dumps(json_data, indent=True))
 
                                 updated_files_count += 1
+                                stat = os.stat(json_file_path)
 
-                            except json.JSONDecodeError as e:
-                                logger.error(f"   ❌ Error parsing JSON file {json_file_path}: {e}")
-                            except Exception as e:
-                                logger.error(f"   ❌ Error processing file {json_file_path}: {e}")
+                            _SEEDED_FILES[json_file_path] = (stat.st_ino, stat.st_mtime_ns, stat.st_size, seed_sig)
 
-                    if updated_files_count > 0:
-                        logger.info(
-                            f"   🌱 Updated {updated_files_count} JSON files with seed data for parcel {folder_name}")
-                else:
-                    logger.warning(f"   ⚠️ No seed data found for parcel {folder_name}")
+                        except json.JSONDecodeError as e:
+                            logger.error(f"   ❌ Error parsing JSON file {json_file_path}: {e}")
+                        except Exception as e:
+                            logger.error(f"   ❌ Error processing file {json_file_path}: {e}")
 
-                # Build relationship files dynamically
-                logger.info(f"   🔗 Building relationship files for {folder_name}")
-                relationship_files, relationship_errors = build_relationship_files(folder_path)
+                if updated_files_count > 0:
+                    logger.info(
+                        f"   🌱 Updated {updated_files_count} JSON files with seed data for parcel {folder_name}")
+            else:
+                logger.warning(f"   ⚠️ No seed data found for parcel {folder_name}")
 
-                # Add any relationship errors to our collection
-                if relationship_errors:
-                    for error in relationship_errors:
-                        all_relationship_errors.append(f"Property {folder_name}: {error}")
+            # Build relationship files dynamically
+            logger.info(f"   🔗 Building relationship files for {folder_name}")
+            relationship_files, relationship_errors = build_relationship_files(folder_path)
 
-                # Only create county data group if no relationship errors
-                if not relationship_errors:
+            # Add any relationship errors to our collection
+            if relationship_errors:
+                for error in relationship_errors:
+                    all_relationship_errors.append(f"Property {folder_name}: {error}")
+
+            # Only create county data group if no relationship errors
+            if not relationship_errors:
+                county_file_path = os.path.join(folder_path, f"{county_data_group_filename}.json")
+                relationships_sig = hashlib.blake2b(
+                    b"\0".join(sorted(f.encode() for f in relationship_files)), digest_size=16).digest()
+
+                # The group only depends on the relationship file names - skip it if they and the file are unchanged
+                try:
+                    stat = os.stat(county_file_path)
+                    county_group_current = (_COUNTY_GROUP_FILES.get(county_file_path)
+                                            == (stat.st_ino, stat.st_mtime_ns, stat.st_size, relationships_sig))
+                except FileNotFoundError:
+                    county_group_current = False
+
+                if county_group_current:
+                    logger.info(f"   ✅ {county_data_group_filename}.json is up to date")
+                else:
                     # Create county data group file with all relationships
                     county_data_group = create_county_data_group(relationship_files)
-                    county_file_path = os.path.join(folder_path, f"{county_data_group_filename}.json")
-
-                    with open(county_file_path, 'w', encoding='utf-8') as f:
-                        json.dump(county_data_group, f, indent=2, ensure_ascii=False)
+                    write_bytes_atomic(county_file_path, json_dumps(county_data_group, indent=True))
+                    stat = os.stat(county_file_path)
+                    _COUNTY_GROUP_FILES[county_file_path] = (stat.st_ino, stat.st_mtime_ns, stat.st_size,
+                                                              relationships_sig)
 
                     logger.info(
                         f"   ✅ Created {county_data_group_filename}.json with {len(relationship_files)} relationship files")
@@ -2369,7 +2738,7 @@ def prepare_data_for_submission(data_dir: str = "data", county_data_group_cid: s
     except Exception as e:
         error_msg = f"Data preparation error: {str(e)}"
         logger.error(error_msg)
-        error_hash = hashlib.md5(error_msg.encode()).hexdigest()
+        error_hash = hashlib.blake2b(error_msg.encode(), digest_size=16).hexdigest()
         return False, error_msg, error_hash
 
 
@@ -2389,6 +2758,11 @@ def run_cli_validator(data_dir: str = "data", county_data_group_cid: str = None)
     return True, "", ""
 
 
+# Entity file name prefixes that build_relationship_files links to property.json
+_FILE_CATEGORY_RE = re.compile(
+    r"person|company|property|address|lot|tax|sales|layout|flood_storm_information|structure|utility")
+
+
 def build_relationship_files(folder_path: str) -> tuple[List[str], List[str]]:
     """
     Build relationship files based on discovered files in the folder
@@ -2398,23 +2772,36 @@ def build_relationship_files(folder_path: str) -> tuple[List[str], List[str]]:
     errors = []
 
     # Get all JSON files in the folder
-    json_files = [f for f in os.listdir(folder_path) if f.endswith('.json')]
-    sales_person_relations = [f for f in json_files if f.startswith('relationship_sales') and 'person' in f]
+    with os.scandir(folder_path) as entries:
+        json_files = [e.name for e in entries if e.name.endswith('.json') and e.is_file()]
+    # Categorize files in one pass - no category prefix is a prefix of another, so the first match is the only one
+    sales_person_relations = []
+    sales_company_relations = []
+    categories = defaultdict(list)
+    for f in json_files:
+        if f.startswith('relationship_sales'):
+            if 'person' in f:
+                sales_person_relations.append(f)
+            if 'company' in f:
+                sales_company_relations.append(f)
+            continue
+        match = _FILE_CATEGORY_RE.match(f)
+        if match:
+            categories[match.group(0)].append(f)
     relationship_files.extend(sales_person_relations)
-    sales_company_relations = [f for f in json_files if f.startswith('relationship_sales') and 'company' in f]
     relationship_files.extend(sales_company_relations)
-    # Categorize files
-    person_files = [f for f in json_files if f.startswith('person')]
-    company_files = [f for f in json_files if f.startswith('company')]
-    property_files = [f for f in json_files if f.startswith('property')]
-    address_files = [f for f in json_files if f.startswith('address')]
-    lot_files = [f for f in json_files if f.startswith('lot')]
-    tax_files = [f for f in json_files if f.startswith('tax')]
-    sales_files = [f for f in json_files if f.startswith('sales')]
-    layout_files = [f for f in json_files if f.startswith('layout')]
-    flood_files = [f for f in json_files if f.startswith('flood_storm_information')]
-    structure_files = [f for f in json_files if f.startswith('structure')]
-    utility_files = [f for f in json_files if f.startswith('utility')]
+
+    person_files = categories['person']
+    company_files = categories['company']
+    property_files = categories['property']
+    address_files = categories['address']
+    lot_files = categories['lot']
+    tax_files = categories['tax']
+    sales_files = categories['sales']
+    layout_files = categories['layout']
+    flood_files = categories['flood_storm_information']
+    structure_files = categories['structure']
+    utility_files = categories['utility']
 
     # Ensure we have property.json as the main reference
     if not property_files:
@@ -2424,34 +2811,35 @@ def build_relationship_files(folder_path: str) -> tuple[List[str], List[str]]:
         return relationship_files, errors
 
     property_file = property_files[0]  # Should be property.json
+    # Every relationship points at property.json from one side - build that IPLD link once and share it
+    property_ref = {"/": f"./{property_file}"}
+    folder_prefix = os.path.join(folder_path, '')  # folder path with a trailing separator, joined once
 
     # Build person/company to property relationships
     for person_file in person_files:
         rel_filename = f"relationship_{person_file.replace('.json', '')}_property.json"
-        rel_path = os.path.join(folder_path, rel_filename)
+        rel_path = folder_prefix + rel_filename
 
         relationship_data = {
             "from": {"/": f"./{person_file}"},
-            "to": {"/": f"./{property_file}"}
+            "to": property_ref
         }
 
-        with open(rel_path, 'w', encoding='utf-8') as f:
-            json.dump(relationship_data, f, indent=2, ensure_ascii=False)
+        write_bytes_atomic(rel_path, json_dumps(relationship_data, indent=True))
 
         relationship_files.append(rel_filename)
         logger.info(f"     📝 Created {rel_filename}")
 
     for company_file in company_files:
         rel_filename = f"relationship_{company_file.replace('.json', '')}_property.json"
-        rel_path = os.path.join(folder_path, rel_filename)
+        rel_path = folder_prefix + rel_filename
 
         relationship_data = {
             "from": {"/": f"./{company_file}"},
-            "to": {"/": f"./{property_file}"}
+            "to": property_ref
         }
 
-        with open(rel_path, 'w', encoding='utf-8') as f:
-            json.dump(relationship_data, f, indent=2, ensure_ascii=False)
+        write_bytes_atomic(rel_path, json_dumps(relationship_data, indent=True))
 
         relationship_files.append(rel_filename)
         logger.info(f"     📝 Created {rel_filename}")
@@ -2481,15 +2869,14 @@ def build_relationship_files(folder_path: str) -> tuple[List[str], List[str]]:
                 suffix = ''
 
             rel_filename = f"relationship_property_{entity_type}{suffix}.json"
-            rel_path = os.path.join(folder_path, rel_filename)
+            rel_path = folder_prefix + rel_filename
 
             relationship_data = {
-                "from": {"/": f"./{property_file}"},
+                "from": property_ref,
                 "to": {"/": f"./{file}"}
             }
 
-            with open(rel_path, 'w', encoding='utf-8') as f:
-                json.dump(relationship_data, f, indent=2, ensure_ascii=False)
+            write_bytes_atomic(rel_path, json_dumps(relationship_data, indent=True))
 
             relationship_files.append(rel_filename)
             logger.info(f"     📝 Created {rel_filename}")
@@ -2497,6 +2884,41 @@ def build_relationship_files(folder_path: str) -> tuple[List[str], List[str]]:
     return relationship_files, errors
 
 
+# Every county relationship, null until a relationship file fills it - copied for each county data group
+_ALL_RELATIONSHIPS_TEMPLATE = {
+    "person_has_property": None,
+    "company_has_property": None,
+    "property_has_address": None,
+    "property_has_lot": None,
+    "property_has_tax": None,
+    "property_has_sales_history": None,
+    "property_has_layout": None,
+    "property_has_flood_storm_information": None,
+    "property_has_file": None,
+    "property_has_structure": None,
+    "property_has_utility": None,
+    "sales_history_has_person": None,
+    "sales_history_has_company": None,
+}
+
+# (substrings the file name must all contain, county relationship key, whether it holds a list of links).
+# Checked in order and the first hit wins, so e.g. relationship_sales_person_property.json stays an owner link
+_COUNTY_RELATIONSHIP_RULES = (
+    (("person", "property"), "person_has_property", True),
+    (("company", "property"), "company_has_property", True),
+    (("property_address",), "property_has_address", False),
+    (("property_lot",), "property_has_lot", False),
+    (("property_tax",), "property_has_tax", True),
+    (("property_sales",), "property_has_sales_history", True),
+    (("property_layout",), "property_has_layout", True),
+    (("property_flood_storm_information",), "property_has_flood_storm_information", False),
+    (("property_utility",), "property_has_utility", False),
+    (("property_structure",), "property_has_structure", False),
+    (("relationship_sales", "person"), "sales_history_has_person", True),
+    (("relationship_sales", "company"), "sales_history_has_company", True),
+)
+
+
 def create_county_data_group(relationship_files: List[str]) -> Dict[str, Any]:
     """
     Create the county data group structure based on relationship files
@@ -2507,77 +2929,28 @@ def create_county_data_group(relationship_files: List[str]) -> Dict[str, Any]:
     }
 
     # Initialize all possible relationships as null
-    all_relationships = {
-        "person_has_property": None,
-        "company_has_property": None,
-        "property_has_address": None,
-        "property_has_lot": None,
-        "property_has_tax": None,
-        "property_has_sales_history": None,
-        "property_has_layout": None,
-        "property_has_flood_storm_information": None,
-        "property_has_file": None,
-        "property_has_structure": None,
-        "property_has_utility": None,
-        "sales_history_has_person": None,
-        "sales_history_has_company": None,
-    }
-
-    # Categorize relationship files
-    person_relationships = []
-    company_relationships = []
-    tax_relationships = []
-    sales_relationships = []
-    layout_relationships = []
-    sales_person_relationships = []
-    sales_company_relationships = []
+    all_relationships = _ALL_RELATIONSHIPS_TEMPLATE.copy()
 
+    # Categorize relationship files against the ordered rule table
+    array_relationships = defaultdict(list)
     for rel_file in relationship_files:
+        for needles, key, is_array in _COUNTY_RELATIONSHIP_RULES:
+            if all(needle in rel_file for needle in needles):
+                break
+        else:
+            logger.warning(f"⚠️ Relationship file {rel_file} matches no county relationship - left out of the group")
+            continue
         ipld_ref = {"/": f"./{rel_file}"}
-
-        if "person" in rel_file and "property" in rel_file:
-            person_relationships.append(ipld_ref)
-        elif "company" in rel_file and "property" in rel_file:
-            company_relationships.append(ipld_ref)
-        elif "property_address" in rel_file:
-            all_relationships["property_has_address"] = ipld_ref
-        elif "property_lot" in rel_file:
-            all_relationships["property_has_lot"] = ipld_ref
-        elif "property_tax" in rel_file:
-            tax_relationships.append(ipld_ref)
-        elif "property_sales" in rel_file:
-            sales_relationships.append(ipld_ref)
-        elif "property_layout" in rel_file:
-            layout_relationships.append(ipld_ref)
-        elif "property_flood_storm_information" in rel_file:
-            all_relationships["property_has_flood_storm_information"] = ipld_ref
-        elif "property_utility" in rel_file:
-            all_relationships["property_has_utility"] = ipld_ref
-        elif "property_structure" in rel_file:
-            all_relationships["property_has_structure"] = ipld_ref
-        elif "relationship_sales" in rel_file and "person" in rel_file:
-            sales_person_relationships.append(ipld_ref)
-        elif "relationship_sales" in rel_file and "company" in rel_file:
-            sales_company_relationships.append(ipld_ref)
+        if is_array:
+            array_relationships[key].append(ipld_ref)
+        else:
+            all_relationships[key] = ipld_ref
 
     # Set array relationships
-    if person_relationships:
-        all_relationships["person_has_property"] = person_relationships
-    if company_relationships:
-        all_relationships["company_has_property"] = company_relationships
-    if tax_relationships:
-        all_relationships["property_has_tax"] = tax_relationships
-    if sales_relationships:
-        all_relationships["property_has_sales_history"] = sales_relationships
-    if layout_relationships:
-        all_relationships["property_has_layout"] = layout_relationships
-    if sales_person_relationships:
-        all_relationships["sales_history_has_person"] = sales_person_relationships
-    if sales_company_relationships:
-        all_relationships["sales_history_has_company"] = sales_company_relationships
-
-    # Only include non-null relationships in the final output
-    county_data["relationships"] = {k: v for k, v in all_relationships.items()}
+    all_relationships.update(array_relationships)
+
+    # Unfilled relationships stay in the output as null
+    county_data["relationships"] = all_relationships
 
     return county_data
 
@@ -2592,18 +2965,26 @@ def load_schemas_from_ipfs(save_to_disk=True):
         schemas_dir = os.path.join(BASE_DIR, "schemas")
         os.makedirs(schemas_dir, exist_ok=True)
 
-    for filename, cid in SCHEMA_CIDS.items():
-        logger.info(f"Fetching schema for {filename} from IPFS...")
-        schema = fetch_schema_from_ipfs(cid)
+    # Fetch every schema concurrently - startup waits for the slowest CID, not the sum of all
+    logger.info(f"Fetching {len(SCHEMA_CIDS)} schemas from IPFS...")
+    with ThreadPoolExecutor(max_workers=len(SCHEMA_CIDS)) as executor:
+        pending = {filename: executor.submit(load_schema, cid) for filename, cid in SCHEMA_CIDS.items()}
+
+    for filename, future in pending.items():
+        try:
+            raw_schema = future.result()
+            schema = json_loads(raw_schema)
+        except ConnectionError:
+            schema = None
         if schema:
             schemas[filename] = schema
             stub_files[filename] = create_stub_from_schema(schema)
 
-            # Save to local file
+            # Save to local file exactly as retrieved - no dict -> json round trip
             if save_to_disk:
                 schema_path = os.path.join(schemas_dir, filename)
-                with open(schema_path, 'w') as f:
-                    json.dump(schema, f, indent=2)
+                with open(schema_path, 'wb') as f:
+                    f.write(raw_schema)
                 logger.info(f"Saved schema to {schema_path}")
 
             logger.info(f"Successfully loaded schema for {filename}")
@@ -2617,42 +2998,57 @@ def load_schemas_from_ipfs(save_to_disk=True):
 def create_stub_from_schema(schema):
     """Create a stub structure from a JSON schema."""
 
-    def create_stub_recursive(properties):
-        stub = {}
+    if 'properties' not in schema:
+        return {}
+
+    # Walk nested properties with an explicit stack: each entry is (stub dict to fill, properties to fill it from)
+    root = {}
+    stack = [(root, schema['properties'])]
+    while stack:
+        stub, properties = stack.pop()
         for key, value in properties.items():
-            if value.get('type') == 'object':
+            value_type = value.get('type')
+            if value_type == 'object':
+                stub[key] = {}
                 if 'properties' in value:
-                    stub[key] = create_stub_recursive(value['properties'])
-                else:
-                    stub[key] = {}
-            elif value.get('type') == 'array':
+                    stack.append((stub[key], value['properties']))
+            elif value_type == 'array':
                 if 'items' in value and value['items'].get('type') == 'object':
+                    item_stub = {}
+                    stub[key] = [item_stub]
                     if 'properties' in value['items']:
-                        stub[key] = [create_stub_recursive(value['items']['properties'])]
-                    else:
-                        stub[key] = [{}]
+                        stack.append((item_stub, value['items']['properties']))
                 else:
                     stub[key] = []
             else:
                 stub[key] = None
-        return stub
+    return root
+
 
-    if 'properties' in schema:
-        return create_stub_recursive(schema['properties'])
-    return {}
+# data/ stat key -> number of property folders it held, so retries only rescan after folders are added or removed.
+# mtime alone can miss a change within the filesystem's timestamp granularity; st_nlink moves with every subfolder
+# added or removed, and st_ino catches data/ being deleted and recreated
+_extraction_count_cache = {'key': None, 'count': 0}
 
 
 def check_extraction_complete(state: WorkflowState) -> bool:
     """Check if all files have been processed and data extracted"""
     data_dir = os.path.join(BASE_DIR, "data")
 
-    if os.path.exists(data_dir):
-        processed_count = len([d for d in os.listdir(data_dir)
-                               if os.path.isdir(os.path.join(data_dir, d))])
-        logger.info(f"Extracted {processed_count} out of {state['input_files_count']} properties")
-        return processed_count >= state['input_files_count']
+    try:
+        st = os.stat(data_dir)
+    except FileNotFoundError:
+        return False
 
-    return False
+    key = (st.st_ino, st.st_mtime_ns, st.st_nlink)
+    if key != _extraction_count_cache['key']:
+        # scandir entries carry their file type, so no path join + stat per entry
+        with os.scandir(data_dir) as entries:
+            _extraction_count_cache['count'] = sum(1 for e in entries if e.is_dir())
+        _extraction_count_cache['key'] = key
+    processed_count = _extraction_count_cache['count']
+    logger.info(f"Extracted {processed_count} out of {state['input_files_count']} properties")
+    return processed_count >= state['input_files_count']
 
 
 async def owner_analysis_node(state: WorkflowState) -> WorkflowState:
@@ -2818,7 +3214,7 @@ def should_retry_owner_analysis(state: WorkflowState) -> str:
     if should_restart_due_to_timeout(state):
         logger.warning("⏰ Owner analysis timeout detected - restarting")
         state['generation_restart_count'] += 1
-        state['last_agent_activity'] = time.time()
+        update_agent_activity(state)
         return "owner_analysis"  # Restart same node
 
     # Normal completion check
@@ -2854,7 +3250,7 @@ def should_retry_structure_extraction(state: WorkflowState) -> str:
     if should_restart_due_to_timeout(state):
         logger.warning("⏰ Structure extraction timeout detected - restarting")
         state['generation_restart_count'] += 1
-        state['last_agent_activity'] = time.time()
+        update_agent_activity(state)
         return "structure_extraction"  # Restart same node
 
     # Normal completion check
@@ -2896,7 +3292,7 @@ async def run_three_node_workflow():
         logger.error("Failed to download scripts from GitHub repository")
 
     logger.info("Loading schemas from IPFS and saving to ./schemas/ directory...")
-    schemas, stub_files = load_schemas_from_ipfs(save_to_disk=True)
+    schemas, stub_files = await asyncio.to_thread(load_schemas_from_ipfs, save_to_disk=True)
 
     if not schemas or not stub_files:
         logger.error("Failed to load schemas from IPFS")
@@ -2910,13 +3306,12 @@ async def run_three_node_workflow():
             logger.error(f"Input directory {INPUT_DIR} does not exist")
             return []
 
-        all_files = os.listdir(INPUT_DIR)
-        input_files = [f for f in all_files if f.endswith(('.html', '.json'))]
+        input_files = list_input_files()
 
         if input_files:
             # Log what we found
-            html_count = len([f for f in input_files if f.endswith('.html')])
-            json_count = len([f for f in input_files if f.endswith('.json')])
+            html_count = sum(1 for f in input_files if f.endswith('.html'))
+            json_count = len(input_files) - html_count
             logger.info(f"Found {len(input_files)} files: {html_count} HTML, {json_count} JSON")
 
         return input_files
@@ -2946,7 +3341,7 @@ async def run_three_node_workflow():
             env={
                 "CODE_STORAGE_DIR": current_dir,
                 "ENV_TYPE": "venv-uv",
-                "UV_VENV_PATH": os.path.join(current_dir, ".venv")
+                "UV_VENV_PATH": VENV_DIR
             },
             cwd=current_dir,
             encoding="utf-8",
@@ -2958,7 +3353,8 @@ async def run_three_node_workflow():
     # Initialize MCP client and tools
     logger.info("Connecting to MCP filesystem server")
     mcp_client = MultiServerMCPClient(server_cfg)
-    tools = await mcp_client.get_tools()
+    # Name order keeps the bound tool schemas identical across agents and runs, so provider prompt caches hit
+    tools = sorted(await mcp_client.get_tools(), key=lambda t: t.name)
     logger.info(f"Connected to MCP server, loaded {len(tools)} tools")
 
     # Initialize model
@@ -2984,7 +3380,7 @@ async def run_three_node_workflow():
         retry_count=0,
         max_retries=3,
         all_files_processed=False,
-        error_history=[],
+        error_history=deque(maxlen=ERROR_HISTORY_LIMIT),
         consecutive_same_errors=0,
         last_error_hash="",
         generation_restart_count=0,
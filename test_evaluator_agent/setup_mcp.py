@@ -6,8 +6,42 @@ import os
 import subprocess
 import sys
 import shutil
+import tarfile
+import tempfile
+import urllib.request
 from pathlib import Path
 
+# Default-branch tarball of mcp_code_executor - one HTTPS download instead of a git clone
+# codeload serves the archive directly, without the API redirect or its unauthenticated rate limit
+MCP_CODE_EXECUTOR_TARBALL_URL = "https://codeload.github.com/bazinga012/mcp_code_executor/tar.gz/HEAD"
+
+
+def download_github_tarball(url, dest_dir):
+    """Stream a GitHub tarball into dest_dir, dropping the archive's top-level '<owner>-<repo>-<sha>/' folder"""
+    # Python versions with extraction filters reject absolute paths, links out of dest_dir, etc.
+    has_data_filter = hasattr(tarfile, "data_filter")
+    extract_kwargs = {"filter": "data"} if has_data_filter else {}
+    real_dest = os.path.realpath(dest_dir)
+    with urllib.request.urlopen(url, timeout=60) as response, \
+            tarfile.open(fileobj=response, mode="r|gz") as tar:
+        for member in tar:
+            _, sep, relative_name = member.name.partition("/")
+            if not sep or not relative_name:
+                continue
+            if os.path.isabs(relative_name) or ".." in Path(relative_name).parts:
+                continue
+            member.name = relative_name
+            if member.islnk():
+                # Hardlink targets are archive paths, so they carry the same top-level folder
+                member.linkname = member.linkname.partition("/")[2]
+            if not has_data_filter and (member.issym() or member.islnk()):
+                # Older Pythons have no filter, so reject links that point outside dest_dir ourselves
+                link_base = os.path.dirname(relative_name) if member.issym() else ""
+                target = os.path.realpath(os.path.join(real_dest, link_base, member.linkname))
+                if os.path.commonpath([real_dest, target]) != real_dest:
+                    raise tarfile.TarError(f"{relative_name!r} would link outside the destination: {member.linkname!r}")
+            tar.extract(member, dest_dir, **extract_kwargs)
+
 
 def setup_uv_venv():
     """Create UV virtual environment if not already present"""
@@ -38,22 +72,27 @@ def setup_uv_venv():
 
 
 def setup_mcp_code_executor():
-    """Clone and install mcp_code_executor if not already present"""
+    """Download and install mcp_code_executor if not already present"""
     current_dir = Path.cwd()
     mcp_dir = current_dir / "mcp_code_executor"
 
     # Check if mcp_code_executor already exists
     if mcp_dir.exists():
-        print("mcp_code_executor already exists, skipping clone...")
+        print("mcp_code_executor already exists, skipping download...")
         return True
 
     try:
-        # Clone the repository
-        print("Cloning mcp_code_executor...")
-        subprocess.run([
-            "git", "clone",
-            "https://github.com/bazinga012/mcp_code_executor.git"
-        ], check=True, cwd=current_dir)
+        # Download the repository - only the current tree is needed to build it, so skip git entirely.
+        # Extract next to the target and rename at the end, so a failed download never looks like a finished one
+        print("Downloading mcp_code_executor...")
+        tmp_dir = tempfile.mkdtemp(dir=current_dir)
+        try:
+            download_github_tarball(MCP_CODE_EXECUTOR_TARBALL_URL, tmp_dir)
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+        os.chmod(tmp_dir, 0o755)  # mkdtemp creates it owner-only
+        os.rename(tmp_dir, mcp_dir)
 
         # Install npm dependencies
         print("Installing npm dependencies...")
@@ -73,15 +112,14 @@ def setup_mcp_code_executor():
 
 
 def check_dependencies():
-    """Check if git, npm, and uv are available"""
+    """Check if npm and uv are available"""
     try:
-        subprocess.run(["git", "--version"], capture_output=True, check=True)
         subprocess.run(["npm", "--version"], capture_output=True, check=True)
         subprocess.run(["uv", "--version"], capture_output=True, check=True)
         return True
     except (subprocess.CalledProcessError, FileNotFoundError):
-        print("Error: git, npm, and uv are required but not found in PATH")
-        print("Please install git, Node.js/npm, and uv before running this package")
+        print("Error: npm and uv are required but not found in PATH")
+        print("Please install Node.js/npm and uv before running this package")
         return False
 
 
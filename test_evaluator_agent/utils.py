@@ -7,8 +7,18 @@ import zipfile
 import shutil
 import json
 import sys
+import threading
+import atexit
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from urllib.parse import urlparse, parse_qs
 
+try:
+    import orjson
+except ImportError:  # orjson is optional - fall back to the stdlib json module
+    orjson = None
+
 BASE_DIR = os.path.abspath(".")
 LOCAL_DIR = os.path.dirname(__file__)
 
@@ -28,12 +38,51 @@ file_handler.setFormatter(file_formatter)
 console_handler = logging.StreamHandler(sys.stdout)
 console_handler.setLevel(logging.CRITICAL)  # Only show critical messages
 
+# Handlers run on a background listener thread so log writes never block the event loop
+log_queue = queue.Queue(-1)
+queue_handler = QueueHandler(log_queue)
+log_listener = QueueListener(
+    log_queue, file_handler, console_handler, respect_handler_level=True
+)
+log_listener.start()
+atexit.register(log_listener.stop)
 
-logging.basicConfig(level=logging.INFO, handlers=[file_handler, console_handler])
+logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
 
 logger = logging.getLogger(__name__)
 
 
+def json_loads(data):
+    """Parse JSON from str or bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, indent=False, sort_keys=False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        option = (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(
+        obj, indent=2 if indent else None, sort_keys=sort_keys, ensure_ascii=False, default=str
+    ).encode("utf-8")
+
+
+def write_bytes_atomic(path, data: bytes):
+    """Write data to a temp file beside path and rename it into place, so readers never see a partial file"""
+    # Unique per process and thread; open() keeps the usual umask-based permissions, unlike mkstemp's 0600
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
 def create_output_zip(output_name: str = "transformed_output.zip") -> bool:
     """Create output ZIP file from processed data"""
     import zipfile
@@ -70,6 +119,22 @@ def create_output_zip(output_name: str = "transformed_output.zip") -> bool:
         return False
 
 
+def parallel_rmtree(root, workers=8):
+    """shutil.rmtree that removes the top-level children concurrently - unlinks release the GIL"""
+
+    def remove(entry):
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.unlink(entry.path)
+
+    with os.scandir(root) as it:
+        children = list(it)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(remove, children))
+    os.rmdir(root)
+
+
 def cleanup_owners_directory():
     """Clean up the owners and data directories at the start of workflow"""
     directories_to_cleanup = [
@@ -80,7 +145,7 @@ def cleanup_owners_directory():
     for dir_name, dir_path in directories_to_cleanup:
         if os.path.exists(dir_path):
             try:
-                shutil.rmtree(dir_path)
+                parallel_rmtree(dir_path)
                 logger.info(f"🗑️ Cleaned up existing {dir_name} directory: {dir_path}")
                 print_status(f"Cleaned up existing {dir_name} directory")
             except Exception as e:
@@ -111,8 +176,8 @@ def import_county_scripts():
     if os.path.exists(seed_csv_path):
         try:
             # Read as JSON since it's actually unnormalized_address.json content
-            with open(seed_csv_path, "r", encoding="utf-8") as f:
-                address_data = json.load(f)
+            with open(seed_csv_path, "rb") as f:
+                address_data = json_loads(f.read())
 
             if "county_jurisdiction" in address_data:
                 county_name = str(address_data["county_jurisdiction"]).strip()
@@ -369,8 +434,8 @@ def create_parcel_folder(
     ]
 
     for filename, data_obj in files_to_create:
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data_obj, f, indent=2, ensure_ascii=False)
+        with open(filename, "wb") as f:
+            f.write(json_dumps(data_obj, indent=True))
 
     return folder_name, unnormalized_address_data, property_seed_data
 
@@ -384,7 +449,7 @@ def process_csv_to_seed_folders(csv_file_path):
     # Clean up output directory
     output_dir = os.path.join(BASE_DIR, "output")
     if os.path.exists(output_dir):
-        shutil.rmtree(output_dir)
+        parallel_rmtree(output_dir)
     os.makedirs(output_dir, exist_ok=True)
 
     try:
@@ -434,7 +499,7 @@ def process_csv_to_seed_folders(csv_file_path):
                         multi_value_query_string_str
                     ):
                         try:
-                            multi_value_query_string = json.loads(
+                            multi_value_query_string = json_loads(
                                 multi_value_query_string_str
                             )
                             logger.info(
@@ -457,7 +522,7 @@ def process_csv_to_seed_folders(csv_file_path):
                     parsed_headers = None
                     if headers:
                         try:
-                            parsed_headers = json.loads(headers)
+                            parsed_headers = json_loads(headers)
                         except json.JSONDecodeError:
                             logger.warning(
                                 f"Row {row_num}: Invalid headers JSON format, ignoring headers"
@@ -465,7 +530,7 @@ def process_csv_to_seed_folders(csv_file_path):
                     parsed_json_body = None
                     if json_body:
                         try:
-                            parsed_json_body = json.loads(json_body)
+                            parsed_json_body = json_loads(json_body)
                         except json.JSONDecodeError:
                             logger.warning(f"Row {row_num}: Invalid json JSON format, ignoring json")
 